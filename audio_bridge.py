@@ -1,17 +1,339 @@
 from __future__ import annotations
 
+import ctypes
+import ctypes.util
 import os
 import re
+import shutil
 import subprocess
 import threading
 import time
-from typing import Any
+import wave
+from collections import ChainMap, deque
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Any, Mapping
+
+
+def _mono_ms() -> int:
+    # Job timestamps are only compared with each other, so use the monotonic clock.
+    return time.monotonic_ns() // 1_000_000
+
+
+_EXE_PATHS: dict[str, str] = {}
+
+
+def _resolve_exe(name: str) -> str:
+    path = _EXE_PATHS.get(name)
+    if path is None:
+        found = shutil.which(name)
+        if not found:
+            # Not cached so a later install is picked up; the bare name makes
+            # subprocess raise the usual FileNotFoundError.
+            return name
+        path = _EXE_PATHS[name] = found
+    return path
+
+
+_SLUG_RE = re.compile(r"[^a-z0-9._-]+")
 
 
 def _safe_slug(raw: str) -> str:
-    text = str(raw or "").strip().lower()
-    text = re.sub(r"[^a-z0-9._-]+", "_", text)
-    return text or "run"
+    return _SLUG_RE.sub("_", str(raw or "").strip().lower()) or "run"
+
+
+def _wav_frame_count(path: str) -> int:
+    # Header size varies (ffmpeg adds a LIST/INFO chunk), so read the data
+    # chunk's frame count instead of comparing the file size to 44 bytes.
+    try:
+        with wave.open(path, "rb") as wav:
+            return wav.getnframes()
+    except Exception:
+        return 0
+
+
+def _parse_short_names(text: str) -> frozenset[str]:
+    return frozenset(line.split("\t", 2)[1] for line in text.splitlines() if "\t" in line)
+
+
+_PACTL_INFO_KEYS = {"Default Sink": 0, "Default Source": 1}
+
+
+def _parse_pactl_info(text: str) -> tuple[str | None, str | None]:
+    found: list[str | None] = [None, None]
+    remaining = len(_PACTL_INFO_KEYS)
+    for line in text.splitlines():
+        key, sep, value = line.strip().partition(":")
+        slot = _PACTL_INFO_KEYS.get(key) if sep else None
+        if slot is None:
+            continue
+        if found[slot] is None:
+            remaining -= 1
+        found[slot] = value.strip()
+        if not remaining:
+            break
+    return found[0], found[1]
+
+
+_JOB_HISTORY = 64
+_STATUS_JOB_LIMIT = 20
+
+
+def _track_job(
+    index: dict[str, dict[str, Any]],
+    recent: deque[tuple[str, dict[str, Any]]],
+    job_id: str,
+    job: dict[str, Any],
+) -> None:
+    previous = index.get(job_id)
+    if previous is not None:
+        try:
+            recent.remove((job_id, previous))
+        except ValueError:
+            pass
+    elif recent.maxlen is not None and len(recent) >= recent.maxlen:
+        evicted_id, _evicted = recent[0]
+        index.pop(evicted_id, None)
+    index[job_id] = job
+    recent.append((job_id, job))
+
+
+# Raw PCM layout produced by the persistent parec recorder.
+_PCM_RATE = 16000
+_PCM_CHANNELS = 1
+_PCM_SAMPLE_BYTES = 2
+_PCM_FRAME_BYTES = _PCM_CHANNELS * _PCM_SAMPLE_BYTES
+_RING_MAX_SECONDS = 60.0
+# Stop the persistent recorder after this long without a capture request.
+_RECORDER_IDLE_S = 120.0
+_STDERR_TAIL_BYTES = 4096
+
+_PA_CONTEXT_READY = 4
+_PA_CONTEXT_FAILED = 5
+_PA_CONTEXT_TERMINATED = 6
+_PA_OPERATION_RUNNING = 0
+
+
+class _PaSampleSpec(ctypes.Structure):
+    _fields_ = [
+        ("format", ctypes.c_int),
+        ("rate", ctypes.c_uint32),
+        ("channels", ctypes.c_uint8),
+    ]
+
+
+class _PaNameInfo(ctypes.Structure):
+    # pa_sink_info / pa_source_info both start with `const char *name`;
+    # only that leading field is read, so the rest of the layout is omitted.
+    _fields_ = [("name", ctypes.c_char_p)]
+
+
+class _PaServerInfo(ctypes.Structure):
+    _fields_ = [
+        ("user_name", ctypes.c_char_p),
+        ("host_name", ctypes.c_char_p),
+        ("server_version", ctypes.c_char_p),
+        ("server_name", ctypes.c_char_p),
+        ("sample_spec", _PaSampleSpec),
+        ("default_sink_name", ctypes.c_char_p),
+        ("default_source_name", ctypes.c_char_p),
+    ]
+
+
+_PA_NAME_INFO_CB = ctypes.CFUNCTYPE(
+    None, ctypes.c_void_p, ctypes.POINTER(_PaNameInfo), ctypes.c_int, ctypes.c_void_p
+)
+_PA_SERVER_INFO_CB = ctypes.CFUNCTYPE(
+    None, ctypes.c_void_p, ctypes.POINTER(_PaServerInfo), ctypes.c_void_p
+)
+
+
+def _load_libpulse():
+    path = ctypes.util.find_library("pulse")
+    if not path:
+        return None
+    try:
+        lib = ctypes.CDLL(path)
+    except OSError:
+        return None
+
+    vp = ctypes.c_void_p
+    lib.pa_mainloop_new.restype = vp
+    lib.pa_mainloop_new.argtypes = []
+    lib.pa_mainloop_get_api.restype = vp
+    lib.pa_mainloop_get_api.argtypes = [vp]
+    lib.pa_mainloop_prepare.restype = ctypes.c_int
+    lib.pa_mainloop_prepare.argtypes = [vp, ctypes.c_int]
+    lib.pa_mainloop_poll.restype = ctypes.c_int
+    lib.pa_mainloop_poll.argtypes = [vp]
+    lib.pa_mainloop_dispatch.restype = ctypes.c_int
+    lib.pa_mainloop_dispatch.argtypes = [vp]
+    lib.pa_mainloop_free.restype = None
+    lib.pa_mainloop_free.argtypes = [vp]
+    lib.pa_context_new.restype = vp
+    lib.pa_context_new.argtypes = [vp, ctypes.c_char_p]
+    lib.pa_context_connect.restype = ctypes.c_int
+    lib.pa_context_connect.argtypes = [vp, ctypes.c_char_p, ctypes.c_int, vp]
+    lib.pa_context_disconnect.restype = None
+    lib.pa_context_disconnect.argtypes = [vp]
+    lib.pa_context_unref.restype = None
+    lib.pa_context_unref.argtypes = [vp]
+    lib.pa_context_get_state.restype = ctypes.c_int
+    lib.pa_context_get_state.argtypes = [vp]
+    lib.pa_context_get_sink_info_list.restype = vp
+    lib.pa_context_get_sink_info_list.argtypes = [vp, _PA_NAME_INFO_CB, vp]
+    lib.pa_context_get_source_info_list.restype = vp
+    lib.pa_context_get_source_info_list.argtypes = [vp, _PA_NAME_INFO_CB, vp]
+    lib.pa_context_get_server_info.restype = vp
+    lib.pa_context_get_server_info.argtypes = [vp, _PA_SERVER_INFO_CB, vp]
+    lib.pa_operation_get_state.restype = ctypes.c_int
+    lib.pa_operation_get_state.argtypes = [vp]
+    lib.pa_operation_unref.restype = None
+    lib.pa_operation_unref.argtypes = [vp]
+    return lib
+
+
+class _PulseClient:
+    """
+    Minimal libpulse client (via ctypes) that keeps one context connected to the
+    native socket so sink/source/server queries do not fork `pactl`.
+    All calls are serialized by an internal lock and drive the mainloop inline.
+    """
+
+    def __init__(self, lib, timeout_s: float = 1.8):
+        self._lib = lib
+        self._timeout_s = max(0.2, float(timeout_s))
+        self._lock = threading.Lock()
+        self._mainloop = None
+        self._context = None
+
+    @classmethod
+    def create(cls) -> "_PulseClient | None":
+        lib = _load_libpulse()
+        if lib is None:
+            return None
+        return cls(lib)
+
+    def _iterate_until(self, done, deadline: float) -> bool:
+        lib = self._lib
+        while not done():
+            remaining_us = int((deadline - time.monotonic()) * 1_000_000)
+            if remaining_us <= 0:
+                return False
+            if lib.pa_mainloop_prepare(self._mainloop, min(remaining_us, 50_000)) < 0:
+                return False
+            if lib.pa_mainloop_poll(self._mainloop) < 0:
+                return False
+            if lib.pa_mainloop_dispatch(self._mainloop) < 0:
+                return False
+        return True
+
+    def _close(self) -> None:
+        lib = self._lib
+        if self._context:
+            lib.pa_context_disconnect(self._context)
+            lib.pa_context_unref(self._context)
+        if self._mainloop:
+            lib.pa_mainloop_free(self._mainloop)
+        self._context = None
+        self._mainloop = None
+
+    def _connect(self) -> bool:
+        lib = self._lib
+        if self._context and lib.pa_context_get_state(self._context) == _PA_CONTEXT_READY:
+            return True
+        self._close()
+
+        self._mainloop = lib.pa_mainloop_new()
+        if not self._mainloop:
+            return False
+        api = lib.pa_mainloop_get_api(self._mainloop)
+        self._context = lib.pa_context_new(api, b"audio_bridge")
+        if not self._context:
+            self._close()
+            return False
+        if lib.pa_context_connect(self._context, None, 0, None) < 0:
+            self._close()
+            return False
+
+        def settled() -> bool:
+            return lib.pa_context_get_state(self._context) in (
+                _PA_CONTEXT_READY,
+                _PA_CONTEXT_FAILED,
+                _PA_CONTEXT_TERMINATED,
+            )
+
+        deadline = time.monotonic() + self._timeout_s
+        if not self._iterate_until(settled, deadline):
+            self._close()
+            return False
+        if lib.pa_context_get_state(self._context) != _PA_CONTEXT_READY:
+            self._close()
+            return False
+        return True
+
+    def _wait_operation(self, op) -> bool:
+        lib = self._lib
+        if not op:
+            return False
+        try:
+            deadline = time.monotonic() + self._timeout_s
+            return self._iterate_until(
+                lambda: lib.pa_operation_get_state(op) != _PA_OPERATION_RUNNING,
+                deadline,
+            )
+        finally:
+            lib.pa_operation_unref(op)
+
+    def list_names(self, kind: str) -> list[str] | None:
+        """Return sink/source names, or None when the server is unreachable."""
+        lib = self._lib
+        if kind == "sinks":
+            query = lib.pa_context_get_sink_info_list
+        elif kind == "sources":
+            query = lib.pa_context_get_source_info_list
+        else:
+            return None
+
+        names: list[str] = []
+
+        def on_info(_ctx, info, eol, _userdata):
+            if eol or not info:
+                return
+            raw = info.contents.name
+            if raw:
+                names.append(raw.decode("utf-8", "replace"))
+
+        cb = _PA_NAME_INFO_CB(on_info)
+        with self._lock:
+            if not self._connect():
+                return None
+            if not self._wait_operation(query(self._context, cb, None)):
+                self._close()
+                return None
+        return names
+
+    def server_defaults(self) -> tuple[str | None, str | None] | None:
+        """Return (default_sink, default_source), or None when unreachable."""
+        lib = self._lib
+        result: dict[str, str | None] = {}
+
+        def on_info(_ctx, info, _userdata):
+            if not info:
+                return
+            sink = info.contents.default_sink_name
+            source = info.contents.default_source_name
+            result["default_sink"] = sink.decode("utf-8", "replace") if sink else None
+            result["default_source"] = source.decode("utf-8", "replace") if source else None
+
+        cb = _PA_SERVER_INFO_CB(on_info)
+        with self._lock:
+            if not self._connect():
+                return None
+            if not self._wait_operation(lib.pa_context_get_server_info(self._context, cb, None)):
+                self._close()
+                return None
+        return result.get("default_sink"), result.get("default_source")
 
 
 class AudioBridge:
@@ -21,68 +343,204 @@ class AudioBridge:
         self.logs_dir = os.path.abspath(logs_dir)
         self.segment_seconds = max(0.2, float(segment_seconds or 4.0))
 
+        # Constant parts of the ffmpeg argv; only paths and duration vary per job.
+        self._capture_cmd_prefix = (
+            "ffmpeg",
+            "-nostdin",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-y",
+            "-f",
+            "pulse",
+            "-i",
+            self.source_name,
+        )
+        self._capture_cmd_suffix = ("-ac", str(_PCM_CHANNELS), "-ar", str(_PCM_RATE))
+        self._play_cmd_prefix = ("ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "error", "-re", "-i")
+        self._play_cmd_suffix = ("-f", "pulse", self.sink_name)
+
         self._lock = threading.Lock()
+        # Jobs are indexed by id and kept in bounded recency order; evicting from
+        # the deque also drops the id from the index so neither grows unbounded.
         self._capture_jobs: dict[str, dict[str, Any]] = {}
         self._play_jobs: dict[str, dict[str, Any]] = {}
+        self._recent_capture: deque[tuple[str, dict[str, Any]]] = deque(maxlen=_JOB_HISTORY)
+        self._recent_play: deque[tuple[str, dict[str, Any]]] = deque(maxlen=_JOB_HISTORY)
         self._last_error: str | None = None
         self._module_sink_id: str | None = None
         self._module_source_id: str | None = None
-        self._status_cache: dict[str, Any] | None = None
-        self._status_cache_ts: float = 0.0
+        # Readers load these without taking self._lock; writers replace them
+        # wholesale (a single attribute store) instead of mutating in place.
+        # (expires_at monotonic ns, body); None means "refresh on next read".
+        self._status_snapshot: tuple[int, Mapping[str, Any]] | None = None
+        self._jobs_snapshot: tuple[tuple[dict[str, Any], ...], tuple[dict[str, Any], ...]] = ((), ())
         self._status_cache_ttl_s: float = 2.5
+        # Separate pools so a capture never queues behind long playbacks.
+        self._capture_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="audiobridge-capture")
+        self._play_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="audiobridge-play")
+        # ffmpeg children of running jobs; close() terminates them so the
+        # (non-daemon) pool workers finish promptly at shutdown.
+        self._live_procs: set[subprocess.Popen] = set()
+        self._closed = False
+        # Persistent recorder: one parec process streams PCM into a byte ring and
+        # segments are sliced out by absolute byte offset.
+        self._recorder_cond = threading.Condition()
+        self._recorder_proc: subprocess.Popen | None = None
+        self._recorder_error: str | None = None
+        self._recorder_last_use = 0.0
+        self._recorder_readers = 0
+        self._ring: deque[bytes] = deque()
+        self._ring_start = 0
+        self._ring_end = 0
+        self._name_cache: dict[str, tuple[int, frozenset[str]]] = {}
+        self._pulse: _PulseClient | None = None
+        self._pulse_probed = False
 
         os.makedirs(self.logs_dir, exist_ok=True)
 
-    def _run(self, cmd: list[str], timeout_s: float = 2.5) -> tuple[int, str, str]:
+    def _run(
+        self,
+        cmd: list[str],
+        timeout_s: float = 2.5,
+        capture_stdout: bool = True,
+    ) -> tuple[int, str, str]:
+        if not capture_stdout:
+            return self._run_quiet(cmd, timeout_s)
         try:
+            # An absolute executable plus close_fds=False (and no cwd/preexec_fn)
+            # lets CPython take its posix_spawn fast path instead of fork+exec.
+            # Our own descriptors are non-inheritable, so nothing leaks.
             proc = subprocess.run(
-                cmd,
+                [_resolve_exe(cmd[0]), *cmd[1:]],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
+                close_fds=False,
                 timeout=max(0.5, float(timeout_s)),
             )
             return proc.returncode, proc.stdout.strip(), proc.stderr.strip()
         except Exception as e:
             return 1, "", str(e)
 
-    def _list_short(self, kind: str) -> list[str]:
+    def _run_quiet(self, cmd: list[str], timeout_s: float) -> tuple[int, str, str]:
+        """
+        Run a long-lived command with stdout discarded, keeping only the last
+        few KB of stderr. stderr is drained continuously so the pipe never fills.
+        """
+        timeout = max(0.5, float(timeout_s))
+        try:
+            proc = subprocess.Popen(
+                [_resolve_exe(cmd[0]), *cmd[1:]],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                close_fds=False,
+            )
+        except Exception as e:
+            return 1, "", str(e)
+        with self._lock:
+            self._live_procs.add(proc)
+            if self._closed:
+                proc.terminate()
+
+        timed_out = threading.Event()
+
+        def kill_on_timeout() -> None:
+            timed_out.set()
+            proc.kill()
+
+        killer = threading.Timer(timeout, kill_on_timeout)
+        killer.daemon = True
+        killer.start()
+        tail = bytearray()
+        try:
+            while True:
+                chunk = proc.stderr.read1(_STDERR_TAIL_BYTES)
+                if not chunk:
+                    break
+                tail += chunk
+                if len(tail) > _STDERR_TAIL_BYTES:
+                    del tail[:-_STDERR_TAIL_BYTES]
+            code = proc.wait()
+        finally:
+            killer.cancel()
+            proc.stderr.close()
+            with self._lock:
+                self._live_procs.discard(proc)
+
+        err = tail.decode("utf-8", "replace").strip()
+        if timed_out.is_set():
+            err = err or f"timed out after {timeout:.1f}s"
+        return code, "", err
+
+    def _pulse_client(self) -> _PulseClient | None:
+        if not self._pulse_probed:
+            self._pulse_probed = True
+            self._pulse = _PulseClient.create()
+        return self._pulse
+
+    def _list_short(self, kind: str) -> frozenset[str]:
         code, out, _ = self._run(["pactl", "list", "short", kind], timeout_s=1.8)
         if code != 0:
-            return []
-        lines = []
-        for raw in out.splitlines():
-            raw = raw.strip()
-            if raw:
-                lines.append(raw)
-        return lines
+            return frozenset()
+        return _parse_short_names(out)
+
+    def _cache_expiry_ns(self) -> int:
+        return time.monotonic_ns() + int(max(0.2, float(self._status_cache_ttl_s)) * 1_000_000_000)
+
+    def _names(self, kind: str) -> frozenset[str]:
+        cached = self._name_cache.get(kind)
+        if cached is not None and time.monotonic_ns() < cached[0]:
+            return cached[1]
+
+        names = None
+        client = self._pulse_client()
+        if client is not None:
+            found = client.list_names(kind)
+            if found is not None:
+                names = frozenset(found)
+        if names is None:
+            names = self._list_short(kind)
+        self._name_cache[kind] = (self._cache_expiry_ns(), names)
+        return names
+
+    def _invalidate_names(self) -> None:
+        self._name_cache.clear()
 
     def _sink_exists(self) -> bool:
-        needle = f"\t{self.sink_name}\t"
-        for line in self._list_short("sinks"):
-            if needle in f"\t{line}\t":
-                return True
-        return False
+        return self.sink_name in self._names("sinks")
 
     def _source_exists(self) -> bool:
-        needle = f"\t{self.source_name}\t"
-        for line in self._list_short("sources"):
-            if needle in f"\t{line}\t":
-                return True
-        return False
+        return self.source_name in self._names("sources")
+
+    def _server_defaults(self) -> tuple[str | None, str | None, str | None]:
+        client = self._pulse_client()
+        if client is not None:
+            defaults = client.server_defaults()
+            if defaults is not None:
+                return defaults[0], defaults[1], None
+
+        code, info_out, info_err = self._run(["pactl", "info"], timeout_s=1.8)
+        default_sink = None
+        default_source = None
+        if code == 0 and info_out:
+            default_sink, default_source = _parse_pactl_info(info_out)
+        return default_sink, default_source, (info_err if code != 0 else None)
 
     def _load_module(self, args: list[str]) -> str | None:
         code, out, err = self._run(["pactl", "load-module", *args], timeout_s=2.5)
         if code != 0:
             self._last_error = err or f"failed: {' '.join(args)}"
             return None
+        self._invalidate_names()
         return (out or "").strip() or None
 
     def ensure_ready(self) -> dict[str, Any]:
         with self._lock:
             self._last_error = None
-            self._status_cache = None
-            self._status_cache_ts = 0.0
+            self._status_snapshot = None
+            self._invalidate_names()
 
             sink_exists = self._sink_exists()
             if not sink_exists:
@@ -118,46 +576,33 @@ class AudioBridge:
                 "last_error": self._last_error,
             }
 
-    def status(self, force_refresh: bool = False) -> dict[str, Any]:
-        now = time.time()
-        with self._lock:
-            capture_jobs = list(self._capture_jobs.values())
-            play_jobs = list(self._play_jobs.values())
-            last_error = self._last_error
-            module_sink_id = self._module_sink_id
-            module_source_id = self._module_source_id
-            cache = self._status_cache
-            cache_ts = float(self._status_cache_ts or 0.0)
-
-        if (
-            not force_refresh
-            and isinstance(cache, dict)
-            and (now - cache_ts) < max(0.2, float(self._status_cache_ttl_s))
-        ):
-            out = dict(cache)
-            out["capture_jobs"] = capture_jobs[-20:]
-            out["play_jobs"] = play_jobs[-20:]
-            out["module_sink_id"] = module_sink_id
-            out["module_source_id"] = module_source_id
-            if last_error:
-                out["last_error"] = last_error
-            return out
+    def status(self, force_refresh: bool = False) -> Mapping[str, Any]:
+        """
+        Return the bridge status as a read-only mapping on every path: a ChainMap
+        of the live job/module fields over the shared frozen body. Callers that
+        need a plain dict (e.g. for JSON) copy it once.
+        """
+        snapshot = self._status_snapshot
+        capture_jobs, play_jobs = self._jobs_snapshot
+        last_error = self._last_error
+        overrides = {
+            "capture_jobs": capture_jobs,
+            "play_jobs": play_jobs,
+            "module_sink_id": self._module_sink_id,
+            "module_source_id": self._module_source_id,
+        }
+        if last_error:
+            overrides["last_error"] = last_error
 
-        code, info_out, info_err = self._run(["pactl", "info"], timeout_s=1.8)
-        default_sink = None
-        default_source = None
-        if code == 0 and info_out:
-            for line in info_out.splitlines():
-                line = line.strip()
-                if line.startswith("Default Sink:"):
-                    default_sink = line.split(":", 1)[1].strip()
-                elif line.startswith("Default Source:"):
-                    default_source = line.split(":", 1)[1].strip()
+        if not force_refresh and snapshot is not None and time.monotonic_ns() < snapshot[0]:
+            return ChainMap(overrides, snapshot[1])
+
+        default_sink, default_source, info_err = self._server_defaults()
 
         sink_exists = self._sink_exists()
         source_exists = self._source_exists()
 
-        out = {
+        body = MappingProxyType({
             "ready": bool(sink_exists and source_exists),
             "sink_name": self.sink_name,
             "source_name": self.source_name,
@@ -165,16 +610,188 @@ class AudioBridge:
             "source_exists": source_exists,
             "default_sink": default_sink,
             "default_source": default_source,
-            "module_sink_id": module_sink_id,
-            "module_source_id": module_source_id,
-            "capture_jobs": capture_jobs[-20:],
-            "play_jobs": play_jobs[-20:],
-            "last_error": last_error or (info_err if code != 0 else None),
-        }
+            "last_error": info_err,
+        })
+        # Build the frozen body off-lock; publishing is a single attribute store.
+        self._status_snapshot = (self._cache_expiry_ns(), body)
+        return ChainMap(overrides, body)
+
+    def _ensure_recorder(self) -> bool:
+        with self._recorder_cond:
+            self._recorder_last_use = time.monotonic()
+            proc = self._recorder_proc
+            if proc is not None and proc.poll() is None:
+                return True
+            cmd = [
+                "parec",
+                f"--device={self.source_name}",
+                f"--rate={_PCM_RATE}",
+                f"--channels={_PCM_CHANNELS}",
+                "--format=s16le",
+                "--raw",
+            ]
+            try:
+                proc = subprocess.Popen(
+                    [_resolve_exe(cmd[0]), *cmd[1:]],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    close_fds=False,
+                )
+            except Exception as e:
+                self._recorder_proc = None
+                self._recorder_error = str(e)
+                return False
+            # Offsets stay monotonic across restarts; realign to a frame boundary.
+            aligned = -(-self._ring_end // _PCM_FRAME_BYTES) * _PCM_FRAME_BYTES
+            self._ring.clear()
+            self._ring_start = aligned
+            self._ring_end = aligned
+            self._recorder_proc = proc
+            self._recorder_error = None
+
+        threading.Thread(
+            target=self._recorder_loop,
+            args=(proc,),
+            name="audiobridge-parec",
+            daemon=True,
+        ).start()
+        return True
+
+    def _recorder_loop(self, proc: subprocess.Popen) -> None:
+        max_bytes = int(_RING_MAX_SECONDS * _PCM_RATE) * _PCM_FRAME_BYTES
+        stdout = proc.stdout
+        while stdout is not None:
+            try:
+                chunk = stdout.read1(8192)
+            except Exception:
+                chunk = b""
+            if not chunk:
+                break
+            with self._recorder_cond:
+                if self._recorder_proc is not proc:
+                    break
+                self._ring.append(chunk)
+                self._ring_end += len(chunk)
+                while self._ring and (self._ring_end - self._ring_start) > max_bytes:
+                    self._ring_start += len(self._ring.popleft())
+                self._recorder_cond.notify_all()
+                idle = (
+                    self._recorder_readers == 0
+                    and time.monotonic() - self._recorder_last_use > _RECORDER_IDLE_S
+                )
+                if idle:
+                    self._recorder_proc = None
+                    self._recorder_error = "recorder_idle"
+            if idle:
+                break
+
+        self._stop_recorder_proc(proc)
+        code = proc.wait()
+        with self._recorder_cond:
+            if self._recorder_proc is proc:
+                self._recorder_proc = None
+                self._recorder_error = f"parec exited with code {code}"
+            self._recorder_cond.notify_all()
+
+    @staticmethod
+    def _stop_recorder_proc(proc: subprocess.Popen) -> None:
+        if proc.poll() is None:
+            try:
+                proc.terminate()
+                proc.wait(timeout=2.0)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+            except Exception:
+                pass
+        if proc.stdout is not None:
+            try:
+                proc.stdout.close()
+            except Exception:
+                pass
+
+    def close(self) -> None:
+        """
+        Shut down for process exit: drop queued jobs, terminate running ffmpeg
+        children and stop the persistent recorder. Safe to call repeatedly.
+        """
+        self._capture_pool.shutdown(wait=False, cancel_futures=True)
+        self._play_pool.shutdown(wait=False, cancel_futures=True)
         with self._lock:
-            self._status_cache = dict(out)
-            self._status_cache_ts = now
-        return out
+            self._closed = True
+            live = list(self._live_procs)
+        for child in live:
+            try:
+                child.terminate()
+            except Exception:
+                pass
+
+        with self._recorder_cond:
+            proc = self._recorder_proc
+            self._recorder_proc = None
+            self._recorder_error = "recorder_closed"
+            self._recorder_cond.notify_all()
+        if proc is not None:
+            self._stop_recorder_proc(proc)
+            proc.wait()
+
+    def _ring_mark(self) -> int:
+        with self._recorder_cond:
+            return -(-self._ring_end // _PCM_FRAME_BYTES) * _PCM_FRAME_BYTES
+
+    def _ring_read(self, start: int, nbytes: int, timeout_s: float) -> tuple[bytes | None, str | None]:
+        end = start + nbytes
+        deadline = time.monotonic() + max(0.5, float(timeout_s))
+        with self._recorder_cond:
+            self._recorder_readers += 1
+            try:
+                while self._ring_end < end:
+                    if self._recorder_proc is None:
+                        return None, self._recorder_error or "recorder_stopped"
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return None, "capture_timeout"
+                    self._recorder_cond.wait(remaining)
+            finally:
+                self._recorder_readers -= 1
+                self._recorder_last_use = time.monotonic()
+            if start < self._ring_start:
+                return None, "capture_overrun"
+
+            parts = []
+            offset = self._ring_start
+            for chunk in self._ring:
+                chunk_end = offset + len(chunk)
+                if chunk_end > start:
+                    parts.append(chunk[max(0, start - offset) : end - offset])
+                offset = chunk_end
+                if offset >= end:
+                    break
+        return b"".join(parts), None
+
+    def _publish_jobs(self) -> None:
+        # Caller holds self._lock.
+        self._jobs_snapshot = (
+            tuple(job for _job_id, job in self._recent_capture)[-_STATUS_JOB_LIMIT:],
+            tuple(job for _job_id, job in self._recent_play)[-_STATUS_JOB_LIMIT:],
+        )
+
+    def _update_job(self, kind: str, job_id: str, **changes: Any) -> None:
+        if kind == "capture":
+            index, recent = self._capture_jobs, self._recent_capture
+        else:
+            index, recent = self._play_jobs, self._recent_play
+        with self._lock:
+            current = index.get(job_id)
+            if current is None:
+                return
+            updated = {**current, **changes}
+            index[job_id] = updated
+            for pos, (recent_id, _job) in enumerate(recent):
+                if recent_id == job_id:
+                    recent[pos] = (job_id, updated)
+                    break
+            self._publish_jobs()
 
     def capture_segment(
         self,
@@ -194,44 +811,66 @@ class AudioBridge:
             "flow_run_id": flow_run_id,
             "audio_ref": out_path,
             "state": "queued",
-            "started_ts": int(time.time() * 1000),
+            "started_ts": _mono_ms(),
             "duration_s": capture_seconds,
         }
         with self._lock:
-            self._capture_jobs[segment_id] = job
+            _track_job(self._capture_jobs, self._recent_capture, segment_id, job)
+            self._publish_jobs()
 
-        def runner():
-            with self._lock:
-                job["state"] = "running"
+        use_ring = self._ensure_recorder()
+        ring_start = self._ring_mark() if use_ring else 0
+        ring_bytes = int(capture_seconds * _PCM_RATE) * _PCM_FRAME_BYTES
+
+        def capture_from_ring() -> tuple[int, str]:
+            pcm, err = self._ring_read(ring_start, ring_bytes, timeout_s=capture_seconds + 8.0)
+            if pcm is None:
+                return 1, err or "capture_failed"
+            try:
+                with wave.open(out_path, "wb") as wav:
+                    wav.setnchannels(_PCM_CHANNELS)
+                    wav.setsampwidth(_PCM_SAMPLE_BYTES)
+                    wav.setframerate(_PCM_RATE)
+                    wav.writeframes(pcm)
+            except Exception as e:
+                return 1, str(e)
+            return 0, ""
+
+        def capture_with_ffmpeg() -> tuple[int, str]:
             cmd = [
-                "ffmpeg",
-                "-nostdin",
-                "-hide_banner",
-                "-loglevel",
-                "error",
-                "-y",
-                "-f",
-                "pulse",
-                "-i",
-                self.source_name,
+                *self._capture_cmd_prefix,
                 "-t",
                 f"{capture_seconds:.2f}",
-                "-ac",
-                "1",
-                "-ar",
-                "16000",
+                *self._capture_cmd_suffix,
                 out_path,
             ]
-            code, _out, err = self._run(cmd, timeout_s=capture_seconds + 8.0)
-            with self._lock:
-                job["finished_ts"] = int(time.time() * 1000)
-                if code == 0 and os.path.isfile(out_path):
-                    job["state"] = "done"
-                else:
-                    job["state"] = "failed"
-                    job["error"] = err or "capture_failed"
-
-        threading.Thread(target=runner, daemon=True).start()
+            code, _out, err = self._run(cmd, timeout_s=capture_seconds + 8.0, capture_stdout=False)
+            return code, err
+
+        def runner():
+            self._update_job("capture", segment_id, state="running")
+            if use_ring:
+                code, err = capture_from_ring()
+            else:
+                code, err = capture_with_ffmpeg()
+            finished_ts = _mono_ms()
+            try:
+                size = os.stat(out_path).st_size
+            except OSError:
+                size = 0
+            if code == 0 and size and _wav_frame_count(out_path) > 0:
+                self._update_job("capture", segment_id, state="done", finished_ts=finished_ts, size=size)
+            else:
+                self._update_job(
+                    "capture",
+                    segment_id,
+                    state="failed",
+                    finished_ts=finished_ts,
+                    size=size,
+                    error=err or ("capture_empty" if code == 0 else "capture_failed"),
+                )
+
+        self._capture_pool.submit(runner)
         return out_path
 
     def play_wav(self, wav_path: str) -> dict[str, Any]:
@@ -248,35 +887,27 @@ class AudioBridge:
             "play_id": play_id,
             "wav_path": path,
             "state": "queued",
-            "started_ts": int(time.time() * 1000),
+            "started_ts": _mono_ms(),
         }
         with self._lock:
-            self._play_jobs[play_id] = job
+            _track_job(self._play_jobs, self._recent_play, play_id, job)
+            self._publish_jobs()
 
         def runner():
-            with self._lock:
-                job["state"] = "running"
-            cmd = [
-                "ffmpeg",
-                "-nostdin",
-                "-hide_banner",
-                "-loglevel",
-                "error",
-                "-re",
-                "-i",
-                path,
-                "-f",
-                "pulse",
-                self.sink_name,
-            ]
-            code, _out, err = self._run(cmd, timeout_s=120.0)
-            with self._lock:
-                job["finished_ts"] = int(time.time() * 1000)
-                if code == 0:
-                    job["state"] = "done"
-                else:
-                    job["state"] = "failed"
-                    job["error"] = err or "play_failed"
-
-        threading.Thread(target=runner, daemon=True).start()
+            self._update_job("play", play_id, state="running")
+            cmd = [*self._play_cmd_prefix, path, *self._play_cmd_suffix]
+            code, _out, err = self._run(cmd, timeout_s=120.0, capture_stdout=False)
+            finished_ts = _mono_ms()
+            if code == 0:
+                self._update_job("play", play_id, state="done", finished_ts=finished_ts)
+            else:
+                self._update_job(
+                    "play",
+                    play_id,
+                    state="failed",
+                    finished_ts=finished_ts,
+                    error=err or "play_failed",
+                )
+
+        self._play_pool.submit(runner)
         return {"ok": True, "play_id": play_id, "wav_path": path}
@@ -3,13 +3,19 @@ Configuration file for AI Teacher system
 All settings in one place for easy modification
 """
 
+import functools
 import os
+import shutil
+
+# Resolve the home directory once; every Chrome profile root below hangs off it.
+_HOME = os.environ.get("HOME") or os.path.expanduser("~")
+_CHROME_CONFIG_DIR = os.path.join(_HOME, ".config", "google-chrome")
 
 # ==================== CHROME SETTINGS ====================
 # Optional: set CHROMEDRIVER_PATH to force a specific driver.
 # If unset, Selenium Manager will download a compatible driver automatically.
 CHROMEDRIVER_PATH = os.getenv("CHROMEDRIVER_PATH")
-CHROME_USER_DATA_ROOT = os.path.expanduser("~/.config/google-chrome/AutoDebugProfile")
+CHROME_USER_DATA_ROOT = os.path.join(_CHROME_CONFIG_DIR, "AutoDebugProfile")
 PROFILE_DIR_NAME = "Default"
 CHROME_USER_PROFILE = os.path.join(CHROME_USER_DATA_ROOT, PROFILE_DIR_NAME)
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -37,13 +43,13 @@ WALKIE_SESSION_TTL_SECONDS = 1800
 # Optional: isolate STT in a separate Chrome profile so it can keep different
 # microphone/site permissions from teacher/ai/class.
 STT_USE_SEPARATE_PROFILE = True
-STT_CHROME_USER_DATA_ROOT = os.path.expanduser("~/.config/google-chrome/AutoDebugProfileSTT")
+STT_CHROME_USER_DATA_ROOT = os.path.join(_CHROME_CONFIG_DIR, "AutoDebugProfileSTT")
 STT_PROFILE_DIR_NAME = "Default"
 CLASS_USE_SEPARATE_PROFILE = True
-CLASS_CHROME_USER_DATA_ROOT = os.path.expanduser("~/.config/google-chrome/AutoDebugProfileClass")
+CLASS_CHROME_USER_DATA_ROOT = os.path.join(_CHROME_CONFIG_DIR, "AutoDebugProfileClass")
 CLASS_PROFILE_DIR_NAME = "Default"
 TEACHER_USE_SEPARATE_PROFILE = True
-TEACHER_CHROME_USER_DATA_ROOT = os.path.expanduser("~/.config/google-chrome/AutoDebugProfileTeacher")
+TEACHER_CHROME_USER_DATA_ROOT = os.path.join(_CHROME_CONFIG_DIR, "AutoDebugProfileTeacher")
 TEACHER_PROFILE_DIR_NAME = "Default"
 
 CHROME_BIN_CANDIDATES = [
@@ -56,12 +62,33 @@ CHROME_BIN_CANDIDATES = [
     "/snap/bin/chromium"
 ]
 
+
+@functools.lru_cache(maxsize=1)
+def resolve_chrome_bin():
+    """First usable entry of CHROME_BIN_CANDIDATES, probed once per process."""
+    for name in CHROME_BIN_CANDIDATES:
+        path = shutil.which(name) or (name if os.path.exists(name) else None)
+        if path:
+            return path
+    return None
+
 # Extra Chrome flags for media/autoplay so pages can start AudioContext without gestures
 CHROME_EXTRA_FLAGS = [
     "--autoplay-policy=no-user-gesture-required",
     # Keep unpacked extension loading stable on newer Chrome builds.
     "--enable-unsafe-extension-debugging",
-    "--disable-features=MediaSessionService,DisableLoadExtensionCommandLineSwitch,CalculateNativeWinOcclusion",
+    # Chrome keeps only the last --disable-features switch, so all entries live here.
+    "--disable-features=MediaSessionService,DisableLoadExtensionCommandLineSwitch,CalculateNativeWinOcclusion,"
+    "Translate,OptimizationHints,MediaRouter,InterestFeedContentSuggestions",
+    # Skip background services (component updater, sync, metrics upload) that
+    # compete with our page loads during startup.
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--metrics-recording-only",
+    # Persistent profiles: keep enough disk cache for the role pages' static assets.
+    f"--disk-cache-size={256 * 1024 * 1024}",
     # Keep rendering/capture stable even when windows/tabs are occluded or in the background.
     "--disable-background-timer-throttling",
     "--disable-renderer-backgrounding",
@@ -80,6 +107,9 @@ TEACHER_DEBUG_PORT = 9225
 TEACHER_DEBUG_ADDR = f"127.0.0.1:{TEACHER_DEBUG_PORT}"
 
 # ==================== URLS ====================
+# Browser window roles; prepare.py keys its per-role handle/xid maps on these.
+WINDOW_NAMES = ("teacher", "stt", "ai", "class")
+
 URLS = {
     "akool": "https://akool.com/apps/streaming-avatar/edit",
     "stt": "https://www.speechtexter.com/",
@@ -124,6 +154,7 @@ AUDIO_CHANNELS = 2
 
 # ==================== TIMING SETTINGS ====================
 # Delays in seconds
+# Upper bound on waiting for DevTools /json/version after the debug port opens.
 CHROME_STARTUP_WAIT = 1.0
 WINDOW_OPEN_DELAY = 0.6
 WINDOW_POSITION_DELAY = 0.2
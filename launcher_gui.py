@@ -15,20 +15,28 @@ Includes:
 from __future__ import annotations
 
 import atexit
+import bisect
+import collections
+import concurrent.futures
+import functools
+import http.client
+import io
 import json
 import os
 import re
+import select
+import selectors
 import shutil
 import signal
-import socket
 import subprocess
 import sys
 import threading
 import time
 import urllib.error
-import urllib.request
 from dataclasses import dataclass
 
+from netprobe import is_tcp_port_open, procfs_listening_pids
+
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 try:
@@ -60,6 +68,36 @@ try:
 except Exception:
     TeacherMediaBridge = None
 
+try:
+    from Xlib import X as _X
+    from Xlib import display as _xdisplay
+except Exception:
+    _X = None
+    _xdisplay = None
+
+try:
+    import orjson as _orjson
+except Exception:
+    _orjson = None
+
+
+def _jdumps(obj) -> bytes:
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj)
+        except TypeError:
+            pass  # non-str keys / oversized ints: let stdlib json handle it
+    return json.dumps(obj).encode("utf-8")
+
+
+def _jloads(raw):
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    if isinstance(raw, (bytes, bytearray)):
+        raw = raw.decode("utf-8")
+    return json.loads(raw)
+
+
 ROUTER_HOST = str(_CFG_ROUTER_HOST or "127.0.0.1")
 ROUTER_PORT = int(_CFG_ROUTER_PORT or 5000)
 ROUTER_BASE = f"http://{ROUTER_HOST}:{ROUTER_PORT}"
@@ -67,6 +105,7 @@ TEACHER_CAM_ENABLED = bool(_CFG_TEACHER_CAM_ENABLED)
 TEACHER_CAM_FPS = int(_CFG_TEACHER_CAM_FPS or 30)
 TEACHER_CAM_WIDTH = int(_CFG_TEACHER_CAM_WIDTH or 960)
 TEACHER_CAM_HEIGHT = int(_CFG_TEACHER_CAM_HEIGHT or 540)
+_FALLBACK_CAPTURE_RECT = (0, 0, TEACHER_CAM_WIDTH, TEACHER_CAM_HEIGHT)
 TEACHER_MEDIA_AUTOSTART = bool(_CFG_TEACHER_MEDIA_AUTOSTART)
 TEACHER_MEDIA_PREWARM = bool(_CFG_TEACHER_MEDIA_PREWARM)
 TEACHER_MEDIA_AUTOSTART_RETRY_INTERVAL_S = max(0.2, float(_CFG_TEACHER_MEDIA_AUTOSTART_RETRY_INTERVAL_S or 1.5))
@@ -83,38 +122,141 @@ FINAL_FOCUS_WORKSPACE = 2
 WORKSPACE_SWITCH_BUFFER_SECONDS = 0.08
 LAUNCHER_TICK_INTERVAL_MS = 1200
 PIPELINE_POLL_INTERVAL_MS = 2000
+# Idle polls back off x1.5 per unchanged round up to this cap; any change resets.
+POLL_IDLE_MAX_INTERVAL_MS = 10000
 PIPELINE_STATUS_REFRESH_EVERY = 4
+# While the router's /pipeline_stream push feed is connected, polling only
+# refreshes the bridge status line at this slower cadence.
+PIPELINE_STREAM_STATUS_INTERVAL_MS = 10000
+ROUTER_HTTP_POOL_SIZE = 4
+# Pipeline/teacher-status polls stretch by this factor while the window is unmapped.
+HIDDEN_POLL_FACTOR = 5
+PIPELINE_STREAM_RETRY_S = 2.0
+PIPELINE_STREAM_UNSUPPORTED_RETRY_S = 30.0
+PIPELINE_STREAM_READ_TIMEOUT_S = 45.0
+LOG_FLUSH_INTERVAL_MS = 50
+SHUTDOWN_SIGNAL_POLL_MS = 200
+LOG_BUFFER_MAX_LINES = 5000
 TEACHER_STATUS_POLL_INTERVAL_S = 2.5
 
 
-def is_tcp_port_open(host: str, port: int, timeout: float = 0.25) -> bool:
-    try:
-        with socket.create_connection((host, port), timeout=timeout):
-            return True
-    except OSError:
-        return False
+@functools.lru_cache(maxsize=16)
+def _which(tool: str):
+    """
+    Cached shutil.which: helpers below poll tools every tick, PATH does not change.
+    """
+    return shutil.which(tool)
+
+
+# Floor for wait loops whose every poll forks wmctrl/xprop; the 2 ms default
+# is only for procfs/socket/waitpid checks that cost a syscall or two.
+SUBPROC_POLL_FLOOR_S = 0.03
+
+
+def _backoff(start: float = 0.002, cap: float = 0.128):
+    """Poll delays for wait loops: start small so quick successes return fast."""
+    delay = float(start)
+    while True:
+        yield delay
+        delay = min(float(cap), delay * 1.5)
+
+
+def _next_poll_interval(current_ms: int, base_ms: int, changed: bool) -> int:
+    if changed:
+        return int(base_ms)
+    return min(int(POLL_IDLE_MAX_INTERVAL_MS), max(int(base_ms), int(current_ms * 1.5)))
+
+
+def _run(cmd, timeout: float, capture_stderr: bool = False) -> subprocess.CompletedProcess:
+    """
+    Run a short helper command and return raw bytes.
+    close_fds=False skips the child's fd sweep (the launcher holds few fds);
+    stderr is discarded unless the caller reports it.
+    """
+    return subprocess.run(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE if capture_stderr else subprocess.DEVNULL,
+        check=False,
+        close_fds=False,
+        timeout=timeout,
+    )
+
+
+def _decode(raw) -> str:
+    return (raw or b"").decode("utf-8", "replace")
 
 
 def _pids_listening_on_port(port: int):
+    # procfs first: listener inodes from /proc/net/tcp{,6}, owners from /proc/*/fd.
+    # Sockets we cannot attribute (other users' processes) fall through to lsof/fuser.
+    pids = procfs_listening_pids(port)
+    if pids is not None:
+        return pids
+
     pids = set()
-    checks = [
-        ["lsof", "-t", "-i", f"TCP:{int(port)}", "-sTCP:LISTEN"],
-        ["fuser", "-n", "tcp", str(int(port))],
-    ]
-    for cmd in checks:
+    if _which("lsof"):
+        # -t: PIDs only; -n/-P: skip host/port name lookups; -S 2: bound kernel
+        # calls (stat/lstat/readlink) that could block on stale mounts.
+        cmd = ["lsof", "-t", "-n", "-P", "-S", "2", "-i", f"TCP:{int(port)}", "-sTCP:LISTEN"]
         try:
-            proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
+            proc = _run(cmd, timeout=3)
         except Exception:
-            continue
-        out = " ".join(
-            part for part in ((proc.stdout or ""), (proc.stderr or "")) if isinstance(part, str)
-        )
-        for token in out.replace("/", " ").replace(":", " ").split():
+            return []
+        for token in (proc.stdout or b"").split():
             if token.isdigit():
                 pids.add(int(token))
+        return sorted(pids)
+
+    # fuser fallback: PIDs go to stdout; the "<port>/tcp:" label goes to stderr
+    # and must not be mistaken for a PID.
+    try:
+        proc = _run(["fuser", "-n", "tcp", str(int(port))], timeout=3)
+    except Exception:
+        return []
+    for token in (proc.stdout or b"").split():
+        if token.isdigit():
+            pids.add(int(token))
     return sorted(pids)
 
 
+def _wait_pids_exit(pids, timeout_s: float) -> bool | None:
+    """
+    Wait for every pid to exit with one selector over their pidfds.
+    Returns None when pidfds are unavailable so callers can fall back to polling.
+    """
+    if not hasattr(os, "pidfd_open"):
+        return None
+    fds = []
+    try:
+        for pid in pids:
+            try:
+                fds.append(os.pidfd_open(int(pid)))
+            except ProcessLookupError:
+                continue
+    except OSError:
+        for fd in fds:
+            os.close(fd)
+        return None
+
+    sel = selectors.DefaultSelector()
+    try:
+        for fd in fds:
+            sel.register(fd, selectors.EVENT_READ)
+        deadline = time.monotonic() + max(0.0, float(timeout_s))
+        while sel.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            for key, _mask in sel.select(remaining):
+                sel.unregister(key.fd)
+        return True
+    finally:
+        sel.close()
+        for fd in fds:
+            os.close(fd)
+
+
 def _terminate_port_listener(port: int, timeout_s: float = 4.0) -> bool:
     pids = _pids_listening_on_port(port)
     if not pids:
@@ -124,56 +266,88 @@ def _terminate_port_listener(port: int, timeout_s: float = 4.0) -> bool:
             os.kill(pid, signal.SIGTERM)
         except Exception:
             pass
-    deadline = time.time() + max(0.2, float(timeout_s))
-    while time.time() < deadline:
+    timeout_s = max(0.2, float(timeout_s))
+    exited = _wait_pids_exit(pids, timeout_s)
+    if exited and not is_tcp_port_open("127.0.0.1", int(port)):
+        return True
+    deadline = time.monotonic() + (0.0 if exited is not None else timeout_s)
+    for delay in _backoff():
         if not is_tcp_port_open("127.0.0.1", int(port)):
             return True
-        time.sleep(0.12)
+        if time.monotonic() >= deadline:
+            break
+        time.sleep(delay)
     pids = _pids_listening_on_port(port)
     for pid in pids:
         try:
             os.kill(pid, signal.SIGKILL)
         except Exception:
             pass
-    time.sleep(0.2)
+    if _wait_pids_exit(pids, 0.5) is None:
+        time.sleep(0.2)
     return not is_tcp_port_open("127.0.0.1", int(port))
 
 
+def _wait_port_or_exit(proc: subprocess.Popen, host: str, port: int, timeout_s: float) -> bool | None:
+    """
+    Wait for proc to start listening on port.
+    True once it listens, False if proc exits first, None on timeout.
+    """
+    # A closed port refuses a connect instantly, so readiness still has to be
+    # probed; the pause between probes sleeps on a pidfd so exit wakes us at once.
+    pidfd = None
+    if hasattr(os, "pidfd_open"):
+        try:
+            pidfd = os.pidfd_open(proc.pid)
+        except OSError:
+            pidfd = None
+    poller = None
+    if pidfd is not None:
+        poller = select.poll()
+        poller.register(pidfd, select.POLLIN)
+    try:
+        deadline = time.monotonic() + max(0.0, float(timeout_s))
+        for delay in _backoff(0.02, 0.1):
+            if is_tcp_port_open(host, port):
+                return True
+            if proc.poll() is not None:
+                return False
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            delay = min(delay, remaining)
+            if poller is not None:
+                poller.poll(int(delay * 1000) or 1)
+            else:
+                time.sleep(delay)
+    finally:
+        if pidfd is not None:
+            os.close(pidfd)
+
+
 def _gsettings_get(schema: str, key: str):
-    if not shutil.which("gsettings"):
+    if not _which("gsettings"):
         return None
     try:
-        proc = subprocess.run(
-            ["gsettings", "get", str(schema), str(key)],
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=1.5,
-        )
+        proc = _run(["gsettings", "get", str(schema), str(key)], timeout=1.5)
     except Exception:
         return None
     if proc.returncode != 0:
         return None
-    val = str(proc.stdout or "").strip()
+    val = _decode(proc.stdout).strip()
     return val if val else None
 
 
 def _gsettings_set(schema: str, key: str, value_literal: str):
-    if not shutil.which("gsettings"):
+    if not _which("gsettings"):
         return False, "gsettings not installed"
     try:
-        proc = subprocess.run(
-            ["gsettings", "set", str(schema), str(key), str(value_literal)],
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=2.0,
-        )
+        proc = _run(["gsettings", "set", str(schema), str(key), str(value_literal)], timeout=2.0, capture_stderr=True)
     except Exception as exc:
         return False, str(exc)
     if proc.returncode == 0:
         return True, ""
-    detail = (proc.stderr or proc.stdout or "").strip()
+    detail = _decode(proc.stderr or proc.stdout).strip()
     return False, detail or "gsettings set failed"
 
 
@@ -197,86 +371,337 @@ def _ensure_static_workspace_floor(min_count: int):
     num_key = "num-workspaces"
 
     dynamic_raw = _gsettings_get(dynamic_schema, dynamic_key)
-    num_raw = _gsettings_get(num_schema, num_key)
-
-    if dynamic_raw == "true":
+    if dynamic_raw != "true":
+        # Already static: nothing to write if the floor is met.
+        count = _observed_workspace_count()
+        if count is not None and int(count) >= min_count:
+            return True, int(count), ""
+    else:
         _gsettings_set(dynamic_schema, dynamic_key, "false")
 
-    desired_num = min_count
+    num_raw = _gsettings_get(num_schema, num_key)
     try:
         current_num = int(str(num_raw or "").strip())
-        if current_num > desired_num:
-            desired_num = current_num
     except Exception:
-        pass
-    _gsettings_set(num_schema, num_key, str(int(desired_num)))
+        current_num = None
+    if current_num is None or current_num < min_count:
+        _gsettings_set(num_schema, num_key, str(int(min_count)))
 
     # Nudge EWMH and verify observed count.
     _wmctrl_ensure_workspace_count(min_count)
-    deadline = time.time() + 2.0
-    while time.time() < deadline:
+    deadline = time.monotonic() + 2.0
+    for delay in _backoff(SUBPROC_POLL_FLOOR_S):
+        _wm_invalidate()
         count = _observed_workspace_count()
         if count is not None and int(count) >= min_count:
             return True, int(count), ""
-        time.sleep(0.08)
+        if time.monotonic() >= deadline:
+            break
+        time.sleep(delay)
+    _wm_invalidate()
     count = _observed_workspace_count()
     return False, count, "workspace floor not reached"
 
 
-def _wmctrl_active_workspace():
-    if not shutil.which("wmctrl"):
+# wmctrl/xprop results are shared for a short window so the workspace helpers
+# (often called back-to-back or from polling loops) fork each tool once.
+# Each query is cached on its own, so a caller only pays for what it reads.
+# Our own workspace changes invalidate explicitly, so the TTL only bounds how
+# late an external change (user switching desktops) is noticed.
+WM_SNAPSHOT_TTL_S = 2.0
+X11_GEOMETRY_TTL_S = 5.0
+X11_RESOLVE_TTL_S = 2.0
+AUTOSTART_RECT_TTL_S = 5.0
+
+
+class _SubprocCache:
+    """
+    Short-TTL memo for helper-command results. None results are not cached.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data = {}
+
+    def get(self, key, ttl_s: float, producer):
+        with self._lock:
+            hit = self._data.get(key)
+        if hit is not None and hit[0] > time.monotonic():
+            return hit[1]
+        value = producer()
+        if value is not None:
+            with self._lock:
+                self._data[key] = (time.monotonic() + float(ttl_s), value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+_subproc_cache = _SubprocCache()
+
+
+def _wm_invalidate() -> None:
+    _subproc_cache.clear()
+
+
+class _XConn:
+    """
+    Long-lived Xlib connection for EWMH reads (python-xlib, optional).
+    Callers fall back to wmctrl/xprop/xwininfo when get() returns None.
+    """
+
+    _inst = None
+    _failed = False
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls):
+        if cls._inst is not None or cls._failed or _xdisplay is None:
+            return cls._inst
+        with cls._lock:
+            if cls._inst is None and not cls._failed:
+                try:
+                    cls._inst = cls(_xdisplay.Display())
+                except Exception:
+                    cls._failed = True
+        return cls._inst
+
+    @classmethod
+    def _drop(cls):
+        inst, cls._inst = cls._inst, None
+        if inst is not None:
+            try:
+                inst.disp.close()
+            except Exception:
+                pass
+
+    def __init__(self, disp):
+        self.disp = disp
+        self.root = disp.screen().root
+        self._atoms = {}
+
+    def _atom(self, name: str):
+        atom = self._atoms.get(name)
+        if atom is None:
+            atom = self.disp.intern_atom(name)
+            self._atoms[name] = atom
+        return atom
+
+    def _prop(self, win, name: str, prop_type=None):
+        prop = win.get_full_property(self._atom(name), prop_type if prop_type is not None else _X.AnyPropertyType)
+        return None if prop is None else prop.value
+
+    def _card(self, win, name: str):
+        value = self._prop(win, name)
+        if value is None or len(value) == 0:
+            return None
+        return int(value[0])
+
+    def _window(self, wid: int):
+        return self.disp.create_resource_object("window", int(wid))
+
+    def _title(self, win) -> bytes:
+        raw = self._prop(win, "_NET_WM_NAME", self._atom("UTF8_STRING"))
+        if not raw:
+            raw = self._prop(win, "WM_NAME")
+        if isinstance(raw, str):
+            raw = raw.encode("utf-8", "replace")
+        return bytes(raw or b"")
+
+    def _call(self, fn):
+        with _XConn._lock:
+            try:
+                return fn()
+            except Exception:
+                # Per-window errors (window vanished) just read as "unknown";
+                # a dead connection is dropped and rebuilt on the next get().
+                try:
+                    self.disp.sync()
+                except Exception:
+                    _XConn._drop()
+                return None
+
+    def active_workspace(self):
+        return self._call(lambda: self._card(self.root, "_NET_CURRENT_DESKTOP"))
+
+    def workspace_count(self):
+        return self._call(lambda: self._card(self.root, "_NET_NUMBER_OF_DESKTOPS"))
+
+    def window_workspace(self, wid: int):
+        def read():
+            ws = self._card(self._window(wid), "_NET_WM_DESKTOP")
+            return -1 if ws == 0xFFFFFFFF else ws
+        return self._call(read)
+
+    def client_windows(self):
+        """
+        [(wid, workspace, lowered title bytes)] from _NET_CLIENT_LIST.
+        """
+        def read():
+            out = []
+            for wid in self._prop(self.root, "_NET_CLIENT_LIST") or []:
+                win = self._window(wid)
+                try:
+                    ws = self._card(win, "_NET_WM_DESKTOP")
+                    title = self._title(win).strip().lower()
+                except Exception:
+                    continue
+                if ws is None or not title:
+                    continue
+                out.append((int(wid), -1 if ws == 0xFFFFFFFF else ws, title))
+            return out
+        return self._call(read)
+
+    def client_titles(self):
+        """
+        [(wid, lowered title bytes)] from _NET_CLIENT_LIST, without the desktop read.
+        """
+        def read():
+            out = []
+            for wid in self._prop(self.root, "_NET_CLIENT_LIST") or []:
+                try:
+                    title = self._title(self._window(wid)).strip().lower()
+                except Exception:
+                    continue
+                out.append((int(wid), title))
+            return out
+        return self._call(read)
+
+    def find_window_by_title(self, substr: str):
+        needle = str(substr or "").strip().lower().encode("utf-8")
+        if not needle:
+            return None
+        for wid, _ws, title in self.client_windows() or []:
+            if needle in title:
+                return wid
+        return None
+
+    def window_geometry(self, wid: int):
+        """
+        Absolute {x, y, width, height} of a window, like xwininfo -id.
+        """
+        def read():
+            win = self._window(wid)
+            geom = win.get_geometry()
+            pos = self.root.translate_coords(win, 0, 0)
+            return {"x": int(pos.x), "y": int(pos.y), "width": int(geom.width), "height": int(geom.height)}
+        return self._call(read)
+
+    def children_sizes(self, wid: int):
+        """
+        [(child_wid, width, height)] for direct children of a window.
+        """
+        def read():
+            out = []
+            for child in self._window(wid).query_tree().children:
+                try:
+                    geom = child.get_geometry()
+                except Exception:
+                    continue
+                out.append((int(child.id), int(geom.width), int(geom.height)))
+            return out
+        return self._call(read)
+
+
+def _wm_desktops():
+    """
+    (active workspace, workspace count), as wmctrl -d reports them.
+    """
+    def query():
+        xconn = _XConn.get()
+        if xconn is not None:
+            count = xconn.workspace_count()
+            if count is not None:
+                return xconn.active_workspace(), count
+        return _wmctrl_query_desktops()
+    return _subproc_cache.get(("wm", "desktops"), WM_SNAPSHOT_TTL_S, query)
+
+
+def _wm_xprop_count():
+    def query():
+        xconn = _XConn.get()
+        if xconn is not None:
+            count = xconn.workspace_count()
+            if count is not None:
+                return count
+        return _xprop_query_workspace_count()
+    return _subproc_cache.get(("wm", "xprop_count"), WM_SNAPSHOT_TTL_S, query)
+
+
+def _wm_windows():
+    """
+    [(workspace, lowered title bytes)] for managed windows.
+    """
+    def query():
+        xconn = _XConn.get()
+        clients = xconn.client_windows() if xconn is not None else None
+        if clients is not None:
+            return [(ws, title) for _wid, ws, title in clients]
+        return _wmctrl_query_windows()
+    return _subproc_cache.get(("wm", "windows"), WM_SNAPSHOT_TTL_S, query)
+
+
+_WMCTRL_DESKTOPS_RX = re.compile(rb"^[ \t]*(\d+)[ \t]+([*-])", re.MULTILINE)
+_XPROP_DESKTOPS_RX = re.compile(rb"_NET_NUMBER_OF_DESKTOPS\(CARDINAL\)\s*=\s*(\d+)")
+_WMCTRL_LIST_RX = re.compile(rb"^0x[0-9a-fA-F]+[ \t]+(-?\d+)[ \t]+\S+[ \t]+(.*?)[ \t]*$", re.MULTILINE)
+
+
+def _wmctrl_query_desktops():
+    if not _which("wmctrl"):
         return None, None
     try:
-        proc = subprocess.run(
-            ["wmctrl", "-d"],
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=2.0,
-        )
+        proc = _run(["wmctrl", "-d"], timeout=2.0)
     except Exception:
         return None, None
 
-    lines = [ln for ln in (proc.stdout or "").splitlines() if ln.strip()]
-    if not lines:
+    matches = _WMCTRL_DESKTOPS_RX.findall(proc.stdout or b"")
+    if not matches:
         return None, None
-
     active = None
-    for ln in lines:
-        cols = ln.split()
-        if not cols:
-            continue
-        try:
-            idx = int(cols[0])
-        except Exception:
-            continue
-        if len(cols) > 1 and cols[1] == "*":
-            active = idx
+    for idx, mark in matches:
+        if mark == b"*":
+            active = int(idx)
             break
-    return active, len(lines)
+    return active, len(matches)
 
 
-def _xprop_workspace_count():
-    if not shutil.which("xprop"):
+def _xprop_query_workspace_count():
+    if not _which("xprop"):
         return None
     try:
-        proc = subprocess.run(
-            ["xprop", "-root", "_NET_NUMBER_OF_DESKTOPS"],
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=1.5,
-        )
+        proc = _run(["xprop", "-root", "_NET_NUMBER_OF_DESKTOPS"], timeout=1.5)
     except Exception:
         return None
-    out = str(proc.stdout or "")
-    m = re.search(r"_NET_NUMBER_OF_DESKTOPS\(CARDINAL\)\s*=\s*(\d+)", out)
+    m = _XPROP_DESKTOPS_RX.search(proc.stdout or b"")
     if not m:
         return None
+    return int(m.group(1))
+
+
+def _wmctrl_query_windows():
+    if not _which("wmctrl"):
+        return []
     try:
-        return int(m.group(1))
+        proc = _run(["wmctrl", "-l"], timeout=2.0)
     except Exception:
-        return None
+        return []
+    # Titles stay as lowered bytes; lookups encode the needle once instead of
+    # decoding every window title.
+    return [
+        (int(m.group(1)), m.group(2).lower())
+        for m in _WMCTRL_LIST_RX.finditer(proc.stdout or b"")
+        if m.group(2)
+    ]
+
+
+def _wmctrl_active_workspace():
+    return _wm_desktops()
+
+
+def _xprop_workspace_count():
+    return _wm_xprop_count()
 
 
 def _observed_workspace_count():
@@ -296,7 +721,7 @@ def _observed_workspace_count():
 
 
 def _wmctrl_ensure_workspace_count(min_count: int) -> bool:
-    if not shutil.which("wmctrl"):
+    if not _which("wmctrl"):
         return False
     try:
         min_count = int(min_count)
@@ -310,99 +735,69 @@ def _wmctrl_ensure_workspace_count(min_count: int) -> bool:
         return True
 
     try:
-        proc = subprocess.run(
-            ["wmctrl", "-n", str(min_count)],
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=2.0,
-        )
+        proc = _run(["wmctrl", "-n", str(min_count)], timeout=2.0)
     except Exception:
         return False
+    finally:
+        _wm_invalidate()
     if proc.returncode != 0:
         return False
 
-    deadline = time.time() + 1.2
-    while time.time() < deadline:
+    deadline = time.monotonic() + 1.2
+    for delay in _backoff(SUBPROC_POLL_FLOOR_S):
+        _wm_invalidate()
         count_after = _observed_workspace_count()
         if count_after is not None and int(count_after) >= min_count:
             return True
-        time.sleep(0.08)
+        if time.monotonic() >= deadline:
+            break
+        time.sleep(delay)
     return False
 
 
 def _wmctrl_window_workspace_by_title(title_substring: str):
-    if not shutil.which("wmctrl"):
-        return None
-    target = str(title_substring or "").strip().lower()
+    target = str(title_substring or "").strip().lower().encode("utf-8")
     if not target:
         return None
-    try:
-        proc = subprocess.run(
-            ["wmctrl", "-l"],
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=2.0,
-        )
-    except Exception:
-        return None
-
-    for line in (proc.stdout or "").splitlines():
-        parts = line.split(None, 3)
-        if len(parts) < 4:
-            continue
-        try:
-            ws = int(parts[1])
-        except Exception:
-            continue
-        title = str(parts[3] or "").strip().lower()
+    for ws, title in _wm_windows():
         if target in title:
             return ws
     return None
 
 
 def _wmctrl_move_window_by_title_to_workspace(title_substring: str, target_ws: int):
-    if not shutil.which("wmctrl"):
+    if not _which("wmctrl"):
         return False, "wmctrl not installed"
     target = str(title_substring or "").strip()
     if not target:
         return False, "empty title"
     try:
-        proc = subprocess.run(
-            ["wmctrl", "-r", target, "-t", str(int(target_ws))],
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=2.0,
-        )
+        proc = _run(["wmctrl", "-r", target, "-t", str(int(target_ws))], timeout=2.0, capture_stderr=True)
     except Exception as e:
         return False, str(e)
+    finally:
+        _wm_invalidate()
 
     if proc.returncode == 0:
         return True, ""
-    detail = (proc.stderr or proc.stdout or "").strip()
+    detail = _decode(proc.stderr or proc.stdout).strip()
     return False, detail or "wmctrl move failed"
 
 
 def _wmctrl_switch_workspace(target_ws: int):
-    if not shutil.which("wmctrl"):
+    if not _which("wmctrl"):
         return False, "wmctrl not installed"
     try:
-        proc = subprocess.run(
-            ["wmctrl", "-s", str(int(target_ws))],
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=2.0,
-        )
+        proc = _run(["wmctrl", "-s", str(int(target_ws))], timeout=2.0, capture_stderr=True)
     except Exception as e:
         return False, str(e)
+    finally:
+        _wm_invalidate()
 
     if proc.returncode == 0:
         time.sleep(max(0.0, float(WORKSPACE_SWITCH_BUFFER_SECONDS)))
         return True, ""
-    detail = (proc.stderr or proc.stdout or "").strip()
+    detail = _decode(proc.stderr or proc.stdout).strip()
     return False, detail or "wmctrl switch failed"
 
 
@@ -410,28 +805,190 @@ def _now_hms() -> str:
     return time.strftime("%H:%M:%S")
 
 
+@functools.lru_cache(maxsize=4096)
+def _format_ts_cached(ts_s: int) -> str:
+    return time.strftime("%H:%M:%S", time.localtime(ts_s))
+
+
+def _json_scalar(value):
+    """
+    JSON text for a flat scalar, or None when json.dumps is needed.
+    """
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, int):
+        return str(int(value))
+    if isinstance(value, str):
+        if value.isascii() and value.isprintable() and '"' not in value and "\\" not in value:
+            return f'"{value}"'
+        return json.dumps(value, ensure_ascii=True)
+    return None
+
+
 def _compact_text(value, max_len: int = 220) -> str:
-    try:
-        if isinstance(value, (dict, list)):
-            text = json.dumps(value, ensure_ascii=True, separators=(",", ":"))
+    text = None
+    if isinstance(value, dict) and len(value) <= 10:
+        # Common route_log payload: a handful of scalar fields. Building the
+        # string directly skips json encoder setup; output matches json.dumps.
+        parts = []
+        for k, v in value.items():
+            if not isinstance(k, str):
+                break
+            key = _json_scalar(k)
+            val = _json_scalar(v)
+            if val is None:
+                break
+            parts.append(f"{key}:{val}")
         else:
+            text = "{" + ",".join(parts) + "}"
+    if text is None:
+        try:
+            if isinstance(value, (dict, list)):
+                text = json.dumps(value, ensure_ascii=True, separators=(",", ":"))
+            else:
+                text = str(value)
+        except Exception:
             text = str(value)
-    except Exception:
-        text = str(value)
     if len(text) > max_len:
         return text[:max_len] + "..."
     return text
 
 
-def _format_route_log_line(raw_line: str):
-    prefix = "[route_log] "
-    if not isinstance(raw_line, str) or not raw_line.startswith(prefix):
+# xwininfo output: "-id" geometry fields and "-tree"/"-children" window rows.
+_RX_XWININFO_FIELD = re.compile(r"^(Width|Height|Absolute upper-left [XY]):\s*(-?\d+)\s*$", re.IGNORECASE)
+# One pass over a raw (bytes) xwininfo -tree dump: id, title (or None), w, h, x, y.
+_RX_TREE_WINDOW = re.compile(
+    rb'^[ \t]*(?P<id>0x[0-9a-f]+)(?:[ \t]+"(?P<title>[^"\n]*)")?[^\n]*?'
+    rb"[ \t](?P<w>\d+)x(?P<h>\d+)\+(?P<x>-?\d+)\+(?P<y>-?\d+)\s",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+_ROUTE_LOG_PREFIX = "[route_log] "
+_ROUTE_LOG_PREFIX_B = _ROUTE_LOG_PREFIX.encode("ascii")
+
+
+def _fmt_client_log_entry(event: str, level: str, data: dict):
+    entry = data.get("entry")
+    if isinstance(entry, dict):
+        entry_event = entry.get("event") or "event"
+        role = entry.get("role") or "unknown"
+        entry_level = str(entry.get("level") or "info").upper()
+        entry_data = entry.get("data") or {}
+        return entry_level, f"{role}::{entry_event} {_compact_text(entry_data)}"
+    return level, f"{event} {_compact_text(data)}"
+
+
+def _fmt_send_message(event: str, level: str, data: dict):
+    return level, (
+        f"router send {data.get('from')} -> {data.get('to')} "
+        f"kind={data.get('kind')} id={data.get('message_id')} "
+        f"text_len={data.get('text_len')}"
+    )
+
+
+def _fmt_lesson_package_expanded(event: str, level: str, data: dict):
+    return level, (
+        f"lesson package expanded book={data.get('book_type')} "
+        f"package={data.get('package_id')} text_len={data.get('text_len')}"
+    )
+
+
+def _fmt_enqueue(event: str, level: str, data: dict):
+    return level, (
+        f"enqueue to={data.get('to')} from={data.get('from')} "
+        f"kind={data.get('kind')} queue={data.get('queue_len')}"
+    )
+
+
+def _fmt_audio_bridge_ready(event: str, level: str, data: dict):
+    return level, (
+        f"audio bridge ready sink={data.get('sink_name')} "
+        f"source={data.get('source_name')}"
+    )
+
+
+def _fmt_audio_segment_captured(event: str, level: str, data: dict):
+    return level, (
+        f"captured segment={data.get('segment_id')} "
+        f"run={data.get('flow_run_id')} audio={data.get('audio_ref')}"
+    )
+
+
+def _fmt_segment_text(event: str, level: str, data: dict):
+    return level, (
+        f"{event} segment={data.get('segment_id')} run={data.get('flow_run_id')} "
+        f"text_len={data.get('text_len')}"
+    )
+
+
+def _fmt_compact(event: str, level: str, data: dict):
+    return level, f"{event} {_compact_text(data)}"
+
+
+def _fmt_walkie_info(event: str, level: str, data: dict):
+    tls_state = "ready" if data.get("tls_ready") else "not-ready"
+    return level, (
+        f"walkie info mode={data.get('class_walkie_mode')} tls={tls_state} "
+        f"receiver={data.get('receiver_local_url')} tx={data.get('transmitter_lan_url')}"
+    )
+
+
+def _fmt_walkie_session(event: str, level: str, data: dict):
+    return level, (
+        f"{event} session={data.get('session_id')} pair={data.get('pair_code')} "
+        f"run={data.get('flow_run_id')}"
+    )
+
+
+def _fmt_get_messages(event: str, level: str, data: dict):
+    return level, f"dequeue receiver={data.get('receiver')} count={data.get('count')}"
+
+
+_EVENT_FORMATTERS = {
+    "client_log_entry": _fmt_client_log_entry,
+    "send_message": _fmt_send_message,
+    "lesson_package_expanded": _fmt_lesson_package_expanded,
+    "enqueue": _fmt_enqueue,
+    "audio_bridge_ready": _fmt_audio_bridge_ready,
+    "audio_segment_captured": _fmt_audio_segment_captured,
+    "stt_segment_finalized": _fmt_segment_text,
+    "student_response_sent": _fmt_segment_text,
+    "student_response_dropped_noise": _fmt_segment_text,
+    "injection_audio_played": _fmt_compact,
+    "injection_text_sent": _fmt_compact,
+    "walkie_info": _fmt_walkie_info,
+    "walkie_session_created": _fmt_walkie_session,
+    "walkie_session_joined": _fmt_walkie_session,
+    "walkie_session_closed": _fmt_walkie_session,
+    "walkie_session_expired": _fmt_walkie_session,
+    "walkie_signal_offer": _fmt_compact,
+    "walkie_signal_answer": _fmt_compact,
+    "walkie_ptt_state": _fmt_compact,
+    "walkie_signal_rejected": _fmt_compact,
+    "get_messages": _fmt_get_messages,
+}
+
+
+def _format_route_log_line(raw_line):
+    if isinstance(raw_line, bytes):
+        if not raw_line.startswith(_ROUTE_LOG_PREFIX_B):
+            return None
+        body = raw_line[len(_ROUTE_LOG_PREFIX_B):]
+    elif isinstance(raw_line, str) and raw_line.startswith(_ROUTE_LOG_PREFIX):
+        body = raw_line[len(_ROUTE_LOG_PREFIX):]
+    else:
         return None
 
     try:
-        payload = json.loads(raw_line[len(prefix):])
+        payload = json.loads(body)
     except Exception:
         return None
+    if not isinstance(payload, dict):
+        return None
 
     event = str(payload.get("event") or "event")
     level = str(payload.get("level") or "info").upper()
@@ -439,85 +996,211 @@ def _format_route_log_line(raw_line: str):
     if not isinstance(data, dict):
         data = {"value": data}
 
-    if event == "client_log_entry":
-        entry = data.get("entry")
-        if isinstance(entry, dict):
-            entry_event = entry.get("event") or "event"
-            role = entry.get("role") or "unknown"
-            entry_level = str(entry.get("level") or "info").upper()
-            entry_data = entry.get("data") or {}
-            return entry_level, f"{role}::{entry_event} {_compact_text(entry_data)}"
+    fn = _EVENT_FORMATTERS.get(event)
+    if fn is not None:
+        return fn(event, level, data)
+    if level in ("WARN", "ERROR"):
         return level, f"{event} {_compact_text(data)}"
+    return None
 
-    if event == "send_message":
-        return level, (
-            f"router send {data.get('from')} -> {data.get('to')} "
-            f"kind={data.get('kind')} id={data.get('message_id')} "
-            f"text_len={data.get('text_len')}"
-        )
-
-    if event == "lesson_package_expanded":
-        return level, (
-            f"lesson package expanded book={data.get('book_type')} "
-            f"package={data.get('package_id')} text_len={data.get('text_len')}"
-        )
-
-    if event == "enqueue":
-        return level, (
-            f"enqueue to={data.get('to')} from={data.get('from')} "
-            f"kind={data.get('kind')} queue={data.get('queue_len')}"
-        )
-
-    if event == "audio_bridge_ready":
-        return level, (
-            f"audio bridge ready sink={data.get('sink_name')} "
-            f"source={data.get('source_name')}"
-        )
 
-    if event == "audio_segment_captured":
-        return level, (
-            f"captured segment={data.get('segment_id')} "
-            f"run={data.get('flow_run_id')} audio={data.get('audio_ref')}"
-        )
+_STATUS_BY_EVENT = {
+    "audio_segment_captured": "captured",
+    "stt_segment_finalized": "transcribed",
+    "student_response_sent": "sent",
+    "student_response_dropped_noise": "dropped",
+}
 
-    if event in ("stt_segment_finalized", "student_response_sent", "student_response_dropped_noise"):
-        return level, (
-            f"{event} segment={data.get('segment_id')} run={data.get('flow_run_id')} "
-            f"text_len={data.get('text_len')}"
-        )
 
-    if event in ("injection_audio_played", "injection_text_sent"):
-        return level, f"{event} {_compact_text(data)}"
+def _mapper_on_segment_status(app, sid: str, event: str, data: dict, ts):
+    app._upsert_mapper_segment(
+        sid,
+        ts=ts,
+        run_id=data.get("flow_run_id") or "",
+        audio_file=data.get("audio_ref") or "",
+        transcript=data.get("text") or app._mapper.transcript(sid) or "",
+        sent_status=_STATUS_BY_EVENT[event],
+    )
 
-    if event == "walkie_info":
-        tls_state = "ready" if data.get("tls_ready") else "not-ready"
-        return level, (
-            f"walkie info mode={data.get('class_walkie_mode')} tls={tls_state} "
-            f"receiver={data.get('receiver_local_url')} tx={data.get('transmitter_lan_url')}"
-        )
 
-    if event in ("walkie_session_created", "walkie_session_joined", "walkie_session_closed", "walkie_session_expired"):
-        return level, (
-            f"{event} session={data.get('session_id')} pair={data.get('pair_code')} "
-            f"run={data.get('flow_run_id')}"
-        )
+def _mapper_on_injection_text(app, sid: str, event: str, data: dict, ts):
+    app._upsert_mapper_segment(
+        sid,
+        ts=ts,
+        run_id=data.get("flow_run_id") or "",
+        transcript=data.get("text") or "",
+        sent_status="sent" if not data.get("dropped") else "dropped",
+    )
 
-    if event in ("walkie_signal_offer", "walkie_signal_answer", "walkie_ptt_state", "walkie_signal_rejected"):
-        return level, f"{event} {_compact_text(data)}"
 
-    if event == "get_messages":
-        return level, f"dequeue receiver={data.get('receiver')} count={data.get('count')}"
+def _mapper_on_injection_audio(app, sid: str, event: str, data: dict, ts):
+    app._upsert_mapper_segment(
+        sid,
+        ts=ts,
+        run_id=data.get("flow_run_id") or "",
+        audio_file=data.get("wav_path") or "",
+        sent_status="captured",
+    )
 
-    if level in ("WARN", "ERROR"):
-        return level, f"{event} {_compact_text(data)}"
 
-    return None
+_MAPPER_EVENT_HANDLERS = dict.fromkeys(_STATUS_BY_EVENT, _mapper_on_segment_status)
+_MAPPER_EVENT_HANDLERS["injection_text_sent"] = _mapper_on_injection_text
+_MAPPER_EVENT_HANDLERS["injection_audio_played"] = _mapper_on_injection_audio
 
 
 @dataclass
 class ServerState:
     proc: subprocess.Popen | None = None
     reader_thread: threading.Thread | None = None
+    pidfd: int | None = None
+
+    def attach(self, proc: subprocess.Popen) -> None:
+        self.detach()
+        self.proc = proc
+        try:
+            self.pidfd = os.pidfd_open(proc.pid)
+        except (AttributeError, OSError):
+            self.pidfd = None
+
+    def detach(self) -> subprocess.Popen | None:
+        proc, self.proc = self.proc, None
+        fd, self.pidfd = self.pidfd, None
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        return proc
+
+    def alive(self) -> bool:
+        """
+        Peek at the child via its pidfd; Popen.poll() (waitpid under a lock)
+        only runs once the pidfd reports the exit, to reap it.
+        """
+        proc, fd = self.proc, self.pidfd
+        if proc is None:
+            return False
+        if fd is not None:
+            try:
+                readable, _w, _x = select.select([fd], [], [], 0)
+                if not readable:
+                    return True
+            except (OSError, ValueError):
+                pass
+        return proc.poll() is None
+
+
+class MapperTable:
+    """
+    Segment mapper rows stored column-wise with one segment_id -> row index.
+    Run ids and statuses repeat across rows and are interned.
+    """
+
+    COLUMNS = ("segment_id", "time", "ts", "run_id", "audio_file", "transcript", "sent_status")
+
+    def __init__(self):
+        self.index: dict[str, int] = {}
+        self.segment_ids: list[str] = []
+        self.times: list[str] = []
+        self.ts: list = []
+        self.run_ids: list[str] = []
+        self.audio_files: list[str] = []
+        self.transcripts: list[str] = []
+        self.statuses: list[str] = []
+        self.tree_iids: list = []
+        # (ts sort key, row) kept sorted so exports need no per-call sort.
+        self._order: list[tuple[int, int]] = []
+
+    @staticmethod
+    def _ts_key(ts) -> int:
+        try:
+            return int(ts or 0)
+        except Exception:
+            return 0
+
+    def __len__(self) -> int:
+        return len(self.segment_ids)
+
+    def transcript(self, segment_id: str) -> str:
+        row = self.index.get(segment_id)
+        return self.transcripts[row] if row is not None else ""
+
+    def upsert(self, segment_id: str, time_text=None, ts=None, run_id=None, audio_file=None,
+               transcript=None, sent_status=None) -> int:
+        row = self.index.get(segment_id)
+        if row is None:
+            row = len(self.segment_ids)
+            self.index[segment_id] = row
+            self.segment_ids.append(segment_id)
+            self.times.append(_now_hms())
+            self.ts.append(int(time.time() * 1000))
+            self.run_ids.append("")
+            self.audio_files.append("")
+            self.transcripts.append("")
+            self.statuses.append("created")
+            self.tree_iids.append(None)
+            bisect.insort(self._order, (self._ts_key(self.ts[row]), row))
+        if ts is not None:
+            old_key = self._ts_key(self.ts[row])
+            new_key = self._ts_key(ts)
+            if new_key != old_key:
+                i = bisect.bisect_left(self._order, (old_key, row))
+                if i < len(self._order) and self._order[i] == (old_key, row):
+                    del self._order[i]
+                bisect.insort(self._order, (new_key, row))
+            self.ts[row] = ts
+        if time_text is not None:
+            self.times[row] = time_text
+        if run_id is not None:
+            self.run_ids[row] = sys.intern(run_id) if type(run_id) is str else run_id
+        if audio_file is not None:
+            self.audio_files[row] = audio_file
+        if transcript is not None:
+            self.transcripts[row] = transcript
+        if sent_status is not None:
+            self.statuses[row] = sys.intern(sent_status) if type(sent_status) is str else sent_status
+        return row
+
+    def values(self, row: int) -> tuple:
+        """
+        Treeview column order.
+        """
+        return (
+            self.times[row] or "",
+            self.run_ids[row] or "",
+            self.segment_ids[row] or "",
+            self.audio_files[row] or "",
+            self.transcripts[row] or "",
+            self.statuses[row] or "",
+        )
+
+    def export_records(self) -> list[dict]:
+        cols = (
+            self.segment_ids, self.times, self.ts, self.run_ids,
+            self.audio_files, self.transcripts, self.statuses,
+        )
+        return [dict(zip(self.COLUMNS, [col[row] for col in cols])) for _key, row in self._order]
+
+
+def _wait_pidfd(pid: int, timeout_s: float) -> bool | None:
+    """
+    Block until pid exits via pidfd + poll (Linux >= 5.3).
+    Returns None when pidfds are unavailable so callers can fall back to polling.
+    """
+    if not sys.platform.startswith("linux") or not hasattr(os, "pidfd_open"):
+        return None
+    try:
+        fd = os.pidfd_open(int(pid))
+    except OSError:
+        return None
+    try:
+        poller = select.poll()
+        poller.register(fd, select.POLLIN)
+        return bool(poller.poll(max(0, int(float(timeout_s) * 1000))))
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
 
 
 def _safe_terminate_process(proc: subprocess.Popen, timeout_s: float = 3.0) -> bool:
@@ -532,27 +1215,55 @@ def _safe_terminate_process(proc: subprocess.Popen, timeout_s: float = 3.0) -> b
     except Exception:
         pass
 
-    deadline = time.time() + max(0.1, float(timeout_s))
-    while time.time() < deadline:
-        try:
-            if proc.poll() is not None:
+    timeout_s = max(0.1, float(timeout_s))
+    exited = _wait_pidfd(proc.pid, timeout_s)
+    if exited is None:
+        deadline = time.monotonic() + timeout_s
+        for delay in _backoff():
+            try:
+                if proc.poll() is not None:
+                    return True
+            except Exception:
                 return True
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(delay)
+    elif exited:
+        try:
+            proc.wait(timeout=1.0)
         except Exception:
-            return True
-        time.sleep(0.1)
+            pass
+        return True
 
     try:
         proc.kill()
     except Exception:
         pass
 
+    try:
+        proc.wait(timeout=0.5)
+    except Exception:
+        pass
     try:
         return proc.poll() is not None
     except Exception:
         return True
 
 
+_SHUTDOWN_SIGNAL = threading.Event()
+
+
+def _install_shutdown_signals() -> None:
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            signal.signal(sig, lambda *_args: _SHUTDOWN_SIGNAL.set())
+        except Exception:
+            pass
+
+
 def _run_with_timeout(fn, timeout_s: float) -> bool:
+    # Daemon thread per call: a wedged fn (e.g. driver.quit) must not keep the
+    # interpreter alive at exit, which pool workers would.
     done = {"ok": False}
 
     def runner():
@@ -583,6 +1294,10 @@ def main() -> int:
             self.root.title("AutoTeacher Launcher")
             self.root.geometry("1280x860")
 
+            self._log_buf = collections.deque(maxlen=LOG_BUFFER_MAX_LINES)
+            self._log_flush_scheduled = False
+            self._log_lock = threading.Lock()
+
             self.server = ServerState()
             self.driver = None
             self._launcher_workspace = None
@@ -602,44 +1317,79 @@ def main() -> int:
             self._teacher_bridge_last_status = {}
             self._teacher_status_poll_ts = 0.0
             self._pipeline_poll_seq = 0
+            self._pipeline_interval_ms = PIPELINE_POLL_INTERVAL_MS
+            self._pipeline_last_state = None
+            self._tick_interval_ms = LAUNCHER_TICK_INTERVAL_MS
+            self._tick_last_state = None
+            self._tick_after_id = None
+            self._router_idle_conns = []
+            self._router_conn_lock = threading.Lock()
+            # Router HTTP and teacher-bridge status reads; results come back via root.after.
+            self._bg_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=3, thread_name_prefix="launcher_bg"
+            )
+            self._teacher_status_fetching = False
+            self._pipeline_fetch_inflight = False
+            self._walkie_supported = None
+            self._pipeline_stream_ok = False
+            self._pipeline_stream_stop = threading.Event()
+            self._pipeline_tick_supported = None
+            self._pipeline_after_id = None
+            self._ui_visible = True
+            for tool in ("xwininfo", "wmctrl", "ffplay", "paplay", "aplay"):
+                _which(tool)
+            # Held only around bridge start/stop/ensure_ready (they fork ffmpeg/pactl);
+            # status snapshots are swapped under the separate state lock.
             self._teacher_media_op_lock = threading.Lock()
+            self._teacher_state_lock = threading.Lock()
+            self._teacher_bridge_inflight = False
             self._teacher_autostart_cancel = threading.Event()
             self._teacher_autostart_thread = None
             self._teacher_autostart_active = False
             self._init_teacher_bridge()
 
-            self._mapper_rows_by_segment = {}
-            self._mapper_records_by_segment = {}
+            # Bound on first use: importing prepare pulls in selenium, which we keep
+            # off the startup path.
+            self._prepare = None
+            self._prepare_bound = False
+
+            self._mapper = MapperTable()
+            self._mapper_dirty_rows = {}
+            self._mapper_flush_pending = False
             self._mapper_hydrated = False
 
             self._build_ui(ttk, filedialog)
             self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+            self.root.bind("<Map>", self._on_root_visibility, add="+")
+            self.root.bind("<Unmap>", self._on_root_visibility, add="+")
+            self.root.bind("<Visibility>", self._on_root_visibility, add="+")
             self.root.after(700, self._place_launcher_on_next_workspace_once)
 
             atexit.register(self._atexit_cleanup)
-            for sig in (signal.SIGINT, signal.SIGTERM):
-                try:
-                    signal.signal(sig, self._signal_handler)
-                except Exception:
-                    pass
 
             self._tick()
             self._poll_pipeline()
+            threading.Thread(target=self._pipeline_stream_loop, daemon=True, name="pipeline_stream").start()
+            self.root.after(SHUTDOWN_SIGNAL_POLL_MS, self._shutdown_signal_poll)
 
         def _next_auto_log_run_id(self) -> str:
             max_idx = 0
-            rx = re.compile(r"^log(\d+)(?:[\.-]|$)", re.IGNORECASE)
             try:
-                for name in os.listdir(os.path.join(BASE_DIR, "logs")):
-                    m = rx.match(str(name or ""))
-                    if not m:
-                        continue
-                    try:
-                        idx = int(m.group(1))
-                    except Exception:
-                        continue
-                    if idx > max_idx:
-                        max_idx = idx
+                with os.scandir(os.path.join(BASE_DIR, "logs")) as it:
+                    for entry in it:
+                        name = entry.name
+                        n = len(name)
+                        if n < 4 or name[:3].lower() != "log":
+                            continue
+                        i = 3
+                        idx = 0
+                        while i < n and "0" <= name[i] <= "9":
+                            idx = idx * 10 + ord(name[i]) - 48
+                            i += 1
+                        if i == 3 or (i < n and name[i] not in ".-"):
+                            continue
+                        if idx > max_idx:
+                            max_idx = idx
             except Exception:
                 pass
             return f"log{max_idx + 1}"
@@ -775,21 +1525,32 @@ def main() -> int:
         def log(self, msg: str, level: str = "INFO"):
             line = f"{_now_hms()} [{level}] {msg}\n"
             print(line, end="")
-
-            def append():
+            with self._log_lock:
+                self._log_buf.append(line)
+                # Arm one flush per burst; an idle log schedules nothing.
+                if self._log_flush_scheduled:
+                    return
+                self._log_flush_scheduled = True
+            try:
+                self.root.after(LOG_FLUSH_INTERVAL_MS, self._flush_log)
+            except Exception:
+                with self._log_lock:
+                    self._log_flush_scheduled = False
+
+        def _flush_log(self):
+            with self._log_lock:
+                lines = list(self._log_buf)
+                self._log_buf.clear()
+                self._log_flush_scheduled = False
+            if lines:
                 try:
                     self.log_text.configure(state="normal")
-                    self.log_text.insert("end", line)
+                    self.log_text.insert("end", "".join(lines))
                     self.log_text.see("end")
                     self.log_text.configure(state="disabled")
                 except Exception:
                     pass
 
-            try:
-                self.root.after(0, append)
-            except Exception:
-                pass
-
         def _clipboard_set(self, text: str):
             try:
                 self.root.clipboard_clear()
@@ -894,11 +1655,8 @@ def main() -> int:
                         return
                     target_ws = fallback_ws
 
-            try:
-                self.root.update_idletasks()
-            except Exception:
-                pass
-
+            # Runs from root.after(700, ...), so mainloop has already mapped and
+            # titled the window; no need to force an idle flush before wmctrl.
             moved, move_detail = _wmctrl_move_window_by_title_to_workspace(self._launcher_title_hint, target_ws)
             switched, switch_detail = _wmctrl_switch_workspace(target_ws)
             detected_ws = _wmctrl_window_workspace_by_title(self._launcher_title_hint)
@@ -942,6 +1700,7 @@ def main() -> int:
                 return
             try:
                 self._teacher_bridge = TeacherMediaBridge()
+                self._teacher_bridge.on_ffmpeg_exit = self._on_teacher_ffmpeg_exit
                 self.teacher_media_status.set("stopped")
                 self.log("Teacher media bridge initialized (manual Start/Stop).")
             except Exception as exc:
@@ -949,6 +1708,14 @@ def main() -> int:
                 self.teacher_media_status.set("init_error")
                 self.log(f"Teacher media bridge init failed: {exc}", "ERROR")
 
+        def _on_teacher_ffmpeg_exit(self):
+            # Bridge reader thread: refresh status now rather than on the next slow tick.
+            try:
+                self.root.after(0, self._poll_teacher_bridge_status, True)
+            except Exception:
+                pass
+            self._wake_tick()
+
         def _cancel_teacher_autostart(self, reason: str = "unspecified"):
             try:
                 self._teacher_autostart_cancel.set()
@@ -960,6 +1727,17 @@ def main() -> int:
             if t is not None and t.is_alive():
                 self.log(f"teacher_media_autostart_cancel reason={reason}")
 
+        def _run_teacher_bridge_op(self, fn, *args):
+            # The bridge holds its own lock for the whole op, so a status() call
+            # would block behind it; polls skip while this flag is set and the
+            # op publishes the fresh status itself.
+            with self._teacher_media_op_lock:
+                self._teacher_bridge_inflight = True
+                try:
+                    return fn(*args)
+                finally:
+                    self._teacher_bridge_inflight = False
+
         def _prewarm_teacher_media_blocking(self, source: str = "unknown") -> bool:
             if not TEACHER_MEDIA_PREWARM:
                 return False
@@ -973,15 +1751,12 @@ def main() -> int:
                 return False
 
             try:
-                with self._teacher_media_op_lock:
-                    status = self._teacher_bridge.ensure_ready()
+                status = self._run_teacher_bridge_op(self._teacher_bridge.ensure_ready)
             except Exception as exc:
                 self.log(f"teacher_media_prewarm_failed reason=exception error={exc}", "WARN")
                 return False
 
-            status = status if isinstance(status, dict) else {}
-            self._teacher_bridge_last_status = status
-            self.teacher_media_status.set(self._teacher_status_text(status))
+            status = self._publish_teacher_status(status)
 
             if status.get("ready"):
                 self.log(
@@ -1029,8 +1804,8 @@ def main() -> int:
             require_window_id = bool(TEACHER_MEDIA_AUTOSTART_REQUIRE_WINDOW_ID)
             window_id_grace_s = min(max(8.0, timeout_s * 0.28), 24.0)
             if require_window_id:
-                has_xwininfo = bool(shutil.which("xwininfo"))
-                has_wmctrl = bool(shutil.which("wmctrl"))
+                has_xwininfo = bool(_which("xwininfo"))
+                has_wmctrl = bool(_which("wmctrl"))
                 if not (has_xwininfo and has_wmctrl):
                     require_window_id = False
                     self.log(
@@ -1039,12 +1814,20 @@ def main() -> int:
                         "WARN",
                     )
 
+            # Only rects with a resolved window id are reused; without one we are
+            # still waiting for the teacher window, so every retry looks again.
+            rect_cache = {"ts": 0.0, "value": None}
             while (time.time() - started) < timeout_s:
                 if self._teacher_autostart_cancel.is_set():
                     return
 
                 attempts += 1
-                capture_rect = self._teacher_capture_rect(allow_focus_switch=False)
+                now = time.monotonic()
+                capture_rect = rect_cache["value"]
+                if capture_rect is None or now - rect_cache["ts"] >= AUTOSTART_RECT_TTL_S:
+                    capture_rect = self._teacher_capture_rect(allow_focus_switch=False)
+                    has_id = isinstance(capture_rect, dict) and capture_rect.get("window_id")
+                    rect_cache["ts"], rect_cache["value"] = now, (capture_rect if has_id else None)
                 window_id = capture_rect.get("window_id") if isinstance(capture_rect, dict) else None
                 self.log(
                     "teacher_media_autostart_attempt "
@@ -1080,7 +1863,7 @@ def main() -> int:
                     )
                     return
 
-                status = self._teacher_bridge_last_status if isinstance(self._teacher_bridge_last_status, dict) else {}
+                status = self._teacher_status_snapshot()
                 last_error = status.get("last_error") or "start_failed"
                 self.log(
                     "teacher_media_autostart_retry "
@@ -1119,44 +1902,114 @@ def main() -> int:
             return text
 
         def _poll_teacher_bridge_status(self, force=False):
-            if self._teacher_bridge is None:
+            if self._teacher_bridge is None or self._teacher_bridge_inflight or self._teacher_status_fetching:
                 return
             now = time.time()
-            if not force and now - self._teacher_status_poll_ts < TEACHER_STATUS_POLL_INTERVAL_S:
+            interval_s = TEACHER_STATUS_POLL_INTERVAL_S * (1 if self._ui_visible else HIDDEN_POLL_FACTOR)
+            if not force and now - self._teacher_status_poll_ts < interval_s:
                 return
             self._teacher_status_poll_ts = now
+            # status() shells out to pactl when its cache is stale; keep that off the Tk thread.
+            if self._submit_bg(self._teacher_bridge.status, self._on_teacher_status_fetched) is not None:
+                self._teacher_status_fetching = True
+
+        def _on_teacher_status_fetched(self, fut):
+            self._teacher_status_fetching = False
             try:
-                status = self._teacher_bridge.status()
-                self._teacher_bridge_last_status = status
-                self.teacher_media_status.set(self._teacher_status_text(status))
+                self._publish_teacher_status(fut.result())
             except Exception as exc:
                 self.teacher_media_status.set(f"error: {exc}")
 
+        def _publish_teacher_status(self, status) -> dict:
+            new = dict(status) if isinstance(status, dict) else {}
+            text = self._teacher_status_text(new)
+            with self._teacher_state_lock:
+                self._teacher_bridge_last_status = new
+            self.teacher_media_status.set(text)
+            return new
+
+        def _teacher_status_snapshot(self) -> dict:
+            with self._teacher_state_lock:
+                return self._teacher_bridge_last_status
+
+        def _router_request(self, method: str, path: str, body, headers: dict, timeout_s: float):
+            # Small pool of keep-alive connections to the router: polls reuse an
+            # idle socket instead of opening (and leaving in TIME_WAIT) a fresh one,
+            # and a slow inject on one thread does not block polls on another.
+            timeout_s = max(0.2, float(timeout_s))
+            headers = dict(headers or {})
+            headers.setdefault("Connection", "keep-alive")
+            for attempt in (0, 1):
+                with self._router_conn_lock:
+                    conn = self._router_idle_conns.pop() if self._router_idle_conns else None
+                reused = conn is not None
+                if conn is None:
+                    conn = http.client.HTTPConnection(ROUTER_HOST, ROUTER_PORT, timeout=timeout_s)
+                conn.timeout = timeout_s
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout_s)
+                try:
+                    conn.request(method, path, body=body, headers=headers)
+                    resp = conn.getresponse()
+                    result = (resp.status, resp.reason, resp.headers, resp.read())
+                except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                    conn.close()
+                    # A reused socket may have been dropped by the server while idle.
+                    if not (reused and attempt == 0 and method == "GET"):
+                        raise
+                    continue
+                except Exception:
+                    conn.close()
+                    raise
+                with self._router_conn_lock:
+                    if len(self._router_idle_conns) < ROUTER_HTTP_POOL_SIZE:
+                        self._router_idle_conns.append(conn)
+                        conn = None
+                if conn is not None:
+                    conn.close()
+                return result
+            raise http.client.RemoteDisconnected("router closed connection")
+
+        def _close_router_conns(self):
+            with self._router_conn_lock:
+                conns, self._router_idle_conns = self._router_idle_conns, []
+            for conn in conns:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+
         def _router_json(self, method: str, path: str, payload=None, timeout_s: float = 2.0):
-            url = f"{ROUTER_BASE}{path}"
             data = None
             headers = {}
             if payload is not None:
-                data = json.dumps(payload).encode("utf-8")
+                data = _jdumps(payload)
                 headers["Content-Type"] = "application/json"
-            req = urllib.request.Request(url=url, data=data, method=method.upper(), headers=headers)
-            with urllib.request.urlopen(req, timeout=max(0.2, float(timeout_s))) as resp:
-                raw = resp.read()
+            status, reason, resp_headers, raw = self._router_request(
+                method.upper(), path, data, headers, timeout_s
+            )
+            if status >= 400:
+                raise urllib.error.HTTPError(f"{ROUTER_BASE}{path}", status, reason, resp_headers, io.BytesIO(raw))
             if not raw:
                 return {}
-            return json.loads(raw.decode("utf-8"))
+            return _jloads(raw)
 
         def _router_supports_walkie(self) -> bool:
+            # Only a positive answer is cached: a failed probe may just be a slow
+            # router, and the negative path restarts it anyway.
+            if self._walkie_supported:
+                return True
             try:
                 info = self._router_json("GET", "/walkie/api/info", timeout_s=1.0)
-                return isinstance(info, dict) and isinstance(info.get("walkie"), dict)
+                self._walkie_supported = isinstance(info, dict) and isinstance(info.get("walkie"), dict)
             except Exception:
-                return False
+                self._walkie_supported = None
+            return bool(self._walkie_supported)
 
         def _format_ts(self, ts_ms):
             try:
-                sec = float(ts_ms) / 1000.0
-                return time.strftime("%H:%M:%S", time.localtime(sec))
+                # Rendered at 1s resolution, so key the cache on whole seconds.
+                return _format_ts_cached(int(float(ts_ms) // 1000))
             except Exception:
                 return _now_hms()
 
@@ -1164,41 +2017,37 @@ def main() -> int:
             if not segment_id:
                 return
             sid = str(segment_id)
-            rec = self._mapper_records_by_segment.get(sid)
-            if rec is None:
-                rec = {
-                    "segment_id": sid,
-                    "time": _now_hms(),
-                    "ts": int(time.time() * 1000),
-                    "run_id": "",
-                    "audio_file": "",
-                    "transcript": "",
-                    "sent_status": "created",
-                }
-                self._mapper_records_by_segment[sid] = rec
-            for k, v in updates.items():
-                if v is not None:
-                    rec[k] = v
-            if updates.get("ts") is not None:
-                rec["time"] = self._format_ts(rec.get("ts"))
-
-            values = (
-                rec.get("time") or "",
-                rec.get("run_id") or "",
-                rec.get("segment_id") or "",
-                rec.get("audio_file") or "",
-                rec.get("transcript") or "",
-                rec.get("sent_status") or "",
+            ts = updates.get("ts")
+            table = self._mapper
+            row = table.upsert(
+                sid,
+                time_text=self._format_ts(ts) if ts is not None else None,
+                **updates,
             )
-            row_id = self._mapper_rows_by_segment.get(sid)
-            if row_id:
-                try:
-                    self.mapper_tree.item(row_id, values=values)
-                except Exception:
-                    row_id = None
-            if not row_id:
-                row_id = self.mapper_tree.insert("", "end", values=values)
-                self._mapper_rows_by_segment[sid] = row_id
+            # Tree writes are coalesced: a burst of events touching the same
+            # rows costs one item()/insert() per row on the next idle pass.
+            self._mapper_dirty_rows[row] = None
+            if not self._mapper_flush_pending:
+                self._mapper_flush_pending = True
+                self.root.after_idle(self._flush_mapper_tree)
+
+        def _flush_mapper_tree(self):
+            self._mapper_flush_pending = False
+            rows, self._mapper_dirty_rows = self._mapper_dirty_rows, {}
+            table = self._mapper
+            for row in rows:
+                values = table.values(row)
+                row_id = table.tree_iids[row]
+                if row_id:
+                    try:
+                        self.mapper_tree.item(row_id, values=values)
+                    except Exception:
+                        row_id = None
+                if not row_id:
+                    try:
+                        table.tree_iids[row] = self.mapper_tree.insert("", "end", values=values)
+                    except Exception:
+                        pass
 
         def _ingest_pipeline_snapshot_segment(self, seg: dict):
             sid = str(seg.get("segment_id") or "")
@@ -1218,61 +2067,167 @@ def main() -> int:
         def _process_pipeline_event(self, entry: dict):
             if not isinstance(entry, dict):
                 return
-            event = str(entry.get("event") or "")
+            event = entry.get("event")
+            handler = _MAPPER_EVENT_HANDLERS.get(event) if isinstance(event, str) else None
+            if handler is None:
+                return
             data = entry.get("data") or {}
             if not isinstance(data, dict):
                 data = {}
-            ts = entry.get("ts")
-
-            if event in ("audio_segment_captured", "stt_segment_finalized", "student_response_sent", "student_response_dropped_noise"):
-                sid = str(data.get("segment_id") or "")
-                if sid:
-                    status_by_event = {
-                        "audio_segment_captured": "captured",
-                        "stt_segment_finalized": "transcribed",
-                        "student_response_sent": "sent",
-                        "student_response_dropped_noise": "dropped",
-                    }
-                    self._upsert_mapper_segment(
-                        sid,
-                        ts=ts,
-                        run_id=data.get("flow_run_id") or "",
-                        audio_file=data.get("audio_ref") or "",
-                        transcript=data.get("text") or self._mapper_records_by_segment.get(sid, {}).get("transcript") or "",
-                        sent_status=status_by_event.get(event, "unknown"),
-                    )
+            sid = str(data.get("segment_id") or "")
+            if sid:
+                handler(self, sid, event, data, entry.get("ts"))
+
+        def _pipeline_stream_loop(self):
+            # Push feed of router events; while it is up _poll_pipeline skips
+            # /get_logs and only refreshes status. Older routers without the
+            # endpoint answer 404 and are retried rarely.
+            # Reconnects resume after the last delivered seq so events already
+            # applied to the mapper are not replayed.
+            stop = self._pipeline_stream_stop
+            last_seq = 0
+            while not stop.is_set():
+                retry_s = PIPELINE_STREAM_RETRY_S
+                conn = None
+                try:
+                    conn = http.client.HTTPConnection(ROUTER_HOST, ROUTER_PORT, timeout=PIPELINE_STREAM_READ_TIMEOUT_S)
+                    conn.request("GET", f"/pipeline_stream?clear=1&since={last_seq}")
+                    resp = conn.getresponse()
+                    if resp.status != 200:
+                        retry_s = PIPELINE_STREAM_UNSUPPORTED_RETRY_S
+                    else:
+                        self._pipeline_stream_ok = True
+                        while not stop.is_set():
+                            line = resp.readline()
+                            if not line:
+                                break
+                            line = line.strip()
+                            if not line:
+                                continue
+                            try:
+                                entry = _jloads(line)
+                            except Exception:
+                                continue
+                            seq = entry.get("seq") if isinstance(entry, dict) else None
+                            if isinstance(seq, int):
+                                last_seq = seq
+                            self.root.after(0, self._process_pipeline_event, entry)
+                except Exception:
+                    pass
+                finally:
+                    self._pipeline_stream_ok = False
+                    if conn is not None:
+                        try:
+                            conn.close()
+                        except Exception:
+                            pass
+                stop.wait(retry_s)
 
-            if event == "injection_text_sent":
-                sid = str(data.get("segment_id") or "")
-                if sid:
-                    self._upsert_mapper_segment(
-                        sid,
-                        ts=ts,
-                        run_id=data.get("flow_run_id") or "",
-                        transcript=data.get("text") or "",
-                        sent_status="sent" if not data.get("dropped") else "dropped",
-                    )
+        def _submit_bg(self, fn, on_done, *args, **kwargs):
+            """
+            Run fn on the background pool; on_done(future) runs on the Tk thread.
+            """
+            def _marshal(fut):
+                try:
+                    self.root.after(0, on_done, fut)
+                except Exception:
+                    pass  # root already destroyed
 
-            if event == "injection_audio_played":
-                sid = str(data.get("segment_id") or "")
-                if sid:
-                    self._upsert_mapper_segment(
-                        sid,
-                        ts=ts,
-                        run_id=data.get("flow_run_id") or "",
-                        audio_file=data.get("wav_path") or "",
-                        sent_status="captured",
-                    )
+            try:
+                fut = self._bg_executor.submit(fn, *args, **kwargs)
+            except RuntimeError:
+                return None  # executor shut down in on_close
+            fut.add_done_callback(_marshal)
+            return fut
+
+        def _fetch_pipeline(self, want_status: bool, want_events: bool):
+            """
+            (status, events) from the router in one /pipeline_tick round trip,
+            or the two legacy endpoints when the router predates it.
+            """
+            if want_events and self._pipeline_tick_supported is not False:
+                path = "/pipeline_tick?clear_logs=1" + ("&include_status=1" if want_status else "")
+                try:
+                    resp = self._router_json("GET", path) or {}
+                    self._pipeline_tick_supported = True
+                    return resp.get("status"), resp.get("events")
+                except urllib.error.HTTPError as exc:
+                    if exc.code != 404:
+                        raise
+                    self._pipeline_tick_supported = False
+            if want_status and want_events:
+                # Only routers without /pipeline_tick get here; the current router
+                # answers status+events in the single request above, so there is
+                # nothing to overlap on that path. Blocking on a pool job from a
+                # pool worker is safe: at most one fetch is in flight and the other
+                # pool jobs are bounded HTTP calls.
+                status_fut = self._bg_executor.submit(self._router_json, "GET", "/pipeline_status")
+                events = (self._router_json("GET", "/get_logs?clear=1") or {}).get("events")
+                return status_fut.result(), events
+            status = self._router_json("GET", "/pipeline_status") if want_status else None
+            events = None
+            if want_events:
+                events = (self._router_json("GET", "/get_logs?clear=1") or {}).get("events")
+            return status, events
+
+        def _on_root_visibility(self, event):
+            if event.widget is not self.root:
+                return
+            etype = getattr(event, "type", None)
+            if etype == tk.EventType.Unmap:
+                visible = False
+            elif etype == tk.EventType.Visibility:
+                visible = "FullyObscured" not in str(getattr(event, "state", ""))
+            else:
+                visible = True
+            was_visible = self._ui_visible
+            self._ui_visible = visible
+            if visible and not was_visible:
+                # Catch up on whatever accumulated while hidden.
+                self.root.after_idle(self._poll_pipeline, True)
+                self._poll_teacher_bridge_status(force=True)
+
+        def _schedule_pipeline_poll(self, delay_ms: int):
+            try:
+                if self._pipeline_after_id is not None:
+                    self.root.after_cancel(self._pipeline_after_id)
+                self._pipeline_after_id = self.root.after(delay_ms, self._poll_pipeline)
+            except Exception:
+                pass
 
-        def _poll_pipeline(self):
+        def _poll_pipeline(self, force: bool = False):
+            if not self._ui_visible and not force:
+                self._schedule_pipeline_poll(PIPELINE_POLL_INTERVAL_MS * HIDDEN_POLL_FACTOR)
+                return
+            if self._pipeline_fetch_inflight:
+                return  # the pending fetch reschedules when it lands
             self._pipeline_poll_seq += 1
+            streaming = self._pipeline_stream_ok
+            should_refresh_status = (
+                streaming
+                or (not self._mapper_hydrated)
+                or (self._pipeline_poll_seq % max(1, int(PIPELINE_STATUS_REFRESH_EVERY)) == 0)
+            )
+            fut = self._submit_bg(
+                self._fetch_pipeline,
+                lambda f: self._on_pipeline_fetched(f, should_refresh_status, streaming),
+                should_refresh_status,
+                not streaming,
+            )
+            if fut is not None:
+                self._pipeline_fetch_inflight = True
+
+        def _on_pipeline_fetched(self, fut, should_refresh_status: bool, streaming: bool):
+            self._pipeline_fetch_inflight = False
+            status = events = None
             try:
-                should_refresh_status = (
-                    (not self._mapper_hydrated)
-                    or (self._pipeline_poll_seq % max(1, int(PIPELINE_STATUS_REFRESH_EVERY)) == 0)
-                )
+                status, events = fut.result()
+            except Exception as exc:
                 if should_refresh_status:
-                    status = self._router_json("GET", "/pipeline_status")
+                    self.pipeline_status.set(f"error: {exc}")
+
+            try:
+                if should_refresh_status and status is not None:
                     bridge = (status or {}).get("audio_bridge") or {}
                     bridge_state = "ready" if bridge.get("ready") else "not_ready"
                     self.pipeline_status.set(
@@ -1287,17 +2242,24 @@ def main() -> int:
             except Exception as exc:
                 self.pipeline_status.set(f"error: {exc}")
 
+            events_seen = 0
             try:
-                logs = self._router_json("GET", "/get_logs?clear=1")
-                for entry in (logs or {}).get("events") or []:
+                for entry in events or []:
+                    events_seen += 1
                     self._process_pipeline_event(entry)
             except Exception:
                 pass
 
-            try:
-                self.root.after(PIPELINE_POLL_INTERVAL_MS, self._poll_pipeline)
-            except Exception:
-                pass
+            state = self.pipeline_status.get()
+            changed = events_seen > 0 or state != self._pipeline_last_state
+            self._pipeline_last_state = state
+            if streaming:
+                self._pipeline_interval_ms = PIPELINE_STREAM_STATUS_INTERVAL_MS
+            else:
+                self._pipeline_interval_ms = _next_poll_interval(
+                    self._pipeline_interval_ms, PIPELINE_POLL_INTERVAL_MS, changed
+                )
+            self._schedule_pipeline_poll(self._pipeline_interval_ms)
 
         def browse_audio(self):
             try:
@@ -1321,14 +2283,13 @@ def main() -> int:
                 "flow_run_id": str(self.inject_run_id.get() or "").strip() or None,
                 "injected_by": "launcher",
             }
-            try:
-                resp = self._router_json("POST", "/inject/student_text", payload=payload)
-                self.log(f"Inject text sent. response={_compact_text(resp)}")
-            except urllib.error.HTTPError as exc:
-                body = exc.read().decode("utf-8", errors="replace") if exc else ""
-                self.log(f"Inject text failed HTTP {exc.code}: {body}", "ERROR")
-            except Exception as exc:
-                self.log(f"Inject text failed: {exc}", "ERROR")
+            self._submit_bg(
+                self._router_json,
+                lambda f: self._on_inject_done(f, "text"),
+                "POST",
+                "/inject/student_text",
+                payload=payload,
+            )
 
         def inject_student_audio(self):
             wav_path = str(self.inject_audio_path.get() or "").strip()
@@ -1340,14 +2301,24 @@ def main() -> int:
                 "flow_run_id": str(self.inject_run_id.get() or "").strip() or None,
                 "injected_by": "launcher",
             }
+            self._submit_bg(
+                self._router_json,
+                lambda f: self._on_inject_done(f, "audio"),
+                "POST",
+                "/inject/student_audio",
+                payload=payload,
+                timeout_s=6.0,
+            )
+
+        def _on_inject_done(self, fut, kind: str):
             try:
-                resp = self._router_json("POST", "/inject/student_audio", payload=payload, timeout_s=6.0)
-                self.log(f"Inject audio sent. response={_compact_text(resp)}")
+                resp = fut.result()
+                self.log(f"Inject {kind} sent. response={_compact_text(resp)}")
             except urllib.error.HTTPError as exc:
                 body = exc.read().decode("utf-8", errors="replace") if exc else ""
-                self.log(f"Inject audio failed HTTP {exc.code}: {body}", "ERROR")
+                self.log(f"Inject {kind} failed HTTP {exc.code}: {body}", "ERROR")
             except Exception as exc:
-                self.log(f"Inject audio failed: {exc}", "ERROR")
+                self.log(f"Inject {kind} failed: {exc}", "ERROR")
 
         def replay_selected_audio(self):
             selected = self.mapper_tree.selection()
@@ -1370,11 +2341,11 @@ def main() -> int:
                 return
 
             player_cmd = None
-            if shutil.which("ffplay"):
+            if _which("ffplay"):
                 player_cmd = ["ffplay", "-nodisp", "-autoexit", "-loglevel", "error", audio_path]
-            elif shutil.which("paplay"):
+            elif _which("paplay"):
                 player_cmd = ["paplay", audio_path]
-            elif shutil.which("aplay"):
+            elif _which("aplay"):
                 player_cmd = ["aplay", audio_path]
 
             if not player_cmd:
@@ -1391,25 +2362,27 @@ def main() -> int:
             out_dir = os.path.join(BASE_DIR, "logs")
             os.makedirs(out_dir, exist_ok=True)
             path = os.path.join(out_dir, f"mapper-export-{int(time.time() * 1000)}.json")
-            items = list(self._mapper_records_by_segment.values())
-            items.sort(key=lambda x: int(x.get("ts") or 0))
+            items = self._mapper.export_records()
             payload = {
                 "created_ts": int(time.time() * 1000),
                 "count": len(items),
                 "segments": items,
             }
             try:
+                # stdlib json: orjson has no ASCII-escape option and exports stay 7-bit.
                 with open(path, "w", encoding="utf-8") as f:
                     json.dump(payload, f, ensure_ascii=True, indent=2)
                 self.log(f"Mapper exported: {path}")
             except Exception as exc:
                 self.log(f"Mapper export failed: {exc}", "ERROR")
 
-        def _normalize_capture_rect(self, rect_obj):
-            fallback = (0, 0, TEACHER_CAM_WIDTH, TEACHER_CAM_HEIGHT)
-            fx, fy, fw, fh = fallback
+        def _normalize_capture_rect(self, rect_obj, window_id=None):
+            fx, fy, fw, fh = _FALLBACK_CAPTURE_RECT
             if not isinstance(rect_obj, dict):
-                return {"x": int(fx), "y": int(fy), "width": int(fw), "height": int(fh)}
+                out = {"x": fx, "y": fy, "width": fw, "height": fh}
+                if window_id:
+                    out["window_id"] = str(window_id)
+                return out
             try:
                 x = int(rect_obj.get("x", fx))
             except Exception:
@@ -1426,11 +2399,12 @@ def main() -> int:
                 h = int(rect_obj.get("height", fh))
             except Exception:
                 h = int(fh)
-            return {"x": max(0, x), "y": max(0, y), "width": max(64, w), "height": max(64, h)}
+            out = {"x": max(0, x), "y": max(0, y), "width": max(64, w), "height": max(64, h)}
+            if window_id:
+                out["window_id"] = str(window_id)
+            return out
 
         def _x11_geometry_for_window_id(self, window_id) -> dict | None:
-            if not shutil.which("xwininfo"):
-                return None
             try:
                 if isinstance(window_id, str):
                     wid = int(window_id.strip(), 0)
@@ -1440,53 +2414,35 @@ def main() -> int:
                 return None
             if wid <= 0:
                 return None
+            geom = _subproc_cache.get(("geom", wid), X11_GEOMETRY_TTL_S, lambda: self._x11_geometry_query(wid))
+            return dict(geom) if geom is not None else None
+
+        def _x11_geometry_query(self, wid: int) -> dict | None:
+            xconn = _XConn.get()
+            if xconn is not None:
+                geom = xconn.window_geometry(wid)
+                if geom is not None:
+                    return geom if geom["width"] and geom["height"] else None
+            if not _which("xwininfo"):
+                return None
 
             try:
-                proc = subprocess.run(
-                    ["xwininfo", "-id", hex(wid)],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                    timeout=2.2,
-                )
-                out = proc.stdout or ""
+                proc = _run(["xwininfo", "-id", hex(wid)], timeout=2.2)
+                out = _decode(proc.stdout)
             except Exception:
                 return None
             if proc.returncode != 0:
                 return None
 
-            width = height = None
-            abs_x = abs_y = None
+            fields = {}
             for raw in out.splitlines():
-                line = raw.strip()
-                m = re.match(r"^Width:\s*(\d+)\s*$", line, re.IGNORECASE)
+                m = _RX_XWININFO_FIELD.match(raw.strip())
                 if m:
-                    try:
-                        width = int(m.group(1))
-                    except Exception:
-                        width = None
-                    continue
-                m = re.match(r"^Height:\s*(\d+)\s*$", line, re.IGNORECASE)
-                if m:
-                    try:
-                        height = int(m.group(1))
-                    except Exception:
-                        height = None
-                    continue
-                m = re.match(r"^Absolute upper-left X:\s*(-?\d+)\s*$", line, re.IGNORECASE)
-                if m:
-                    try:
-                        abs_x = int(m.group(1))
-                    except Exception:
-                        abs_x = None
-                    continue
-                m = re.match(r"^Absolute upper-left Y:\s*(-?\d+)\s*$", line, re.IGNORECASE)
-                if m:
-                    try:
-                        abs_y = int(m.group(1))
-                    except Exception:
-                        abs_y = None
-                    continue
+                    fields[m.group(1).lower()] = int(m.group(2))
+            width = fields.get("width")
+            height = fields.get("height")
+            abs_x = fields.get("absolute upper-left x")
+            abs_y = fields.get("absolute upper-left y")
 
             if not width or not height:
                 return None
@@ -1497,24 +2453,29 @@ def main() -> int:
                 "height": int(height),
             }
 
+        def _prepare_module(self):
+            if not self._prepare_bound:
+                self._prepare_bound = True
+                try:
+                    import prepare  # local import avoids startup cycles
+
+                    self._prepare = prepare
+                except Exception:
+                    self._prepare = None
+            return self._prepare
+
         def _resolve_x11_capture_window_id_for_rect(self, rect: dict, title_hint: str = "") -> str | None:
             if not isinstance(rect, dict):
                 return None
             hint = str(title_hint or "").strip().lower()
             if not hint:
                 hint = "akool"
+            key = ("resolve", hint) + tuple(rect.get(k) for k in ("x", "y", "width", "height"))
+            return _subproc_cache.get(
+                key, X11_RESOLVE_TTL_S, lambda: self._resolve_x11_capture_window_id_query(rect, hint)
+            )
 
-            # First choice: reuse prepare.py's relaxed resolver (wmctrl + xwininfo fallback).
-            try:
-                from prepare import _resolve_x11_window_id_for_rect as _prepare_resolve
-                wid = _prepare_resolve(rect, title_hint=hint, preferred_pids=None)
-                if wid:
-                    return str(wid)
-            except Exception:
-                pass
-
-            if not shutil.which("xwininfo"):
-                return None
+        def _resolve_x11_capture_window_id_query(self, rect: dict, hint: str) -> str | None:
             try:
                 tx = int(rect.get("x", 0))
                 ty = int(rect.get("y", 0))
@@ -1523,95 +2484,105 @@ def main() -> int:
             except Exception:
                 return None
 
-            try:
-                proc = subprocess.run(
-                    ["xwininfo", "-root", "-tree"],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                    timeout=2.5,
-                )
-                out = proc.stdout or ""
-            except Exception:
-                return None
+            prep = self._prepare_module()
+            # First choice: reuse prepare.py's relaxed resolver (wmctrl + xwininfo fallback).
+            if prep is not None:
+                try:
+                    wid = prep._resolve_x11_window_id_for_rect(rect, title_hint=hint, preferred_pids=None)
+                    if wid:
+                        return str(wid)
+                except Exception:
+                    pass
 
-            best_id = None
-            best_score = None
-            rx_with_title = re.compile(
-                r'^\s*(0x[0-9a-f]+)\s+"([^"]*)".*?\s+(\d+)x(\d+)\+(-?\d+)\+(-?\d+)\s',
-                re.IGNORECASE,
-            )
-            rx_plain = re.compile(r"^\s*(0x[0-9a-f]+)\s+.*?\s+(\d+)x(\d+)\+(-?\d+)\+(-?\d+)\s", re.IGNORECASE)
-            hint_tokens = [tok for tok in re.split(r"\s+", hint) if len(tok) >= 4][:4]
-            for line in out.splitlines():
-                m = rx_with_title.search(line)
-                title = ""
-                if m:
-                    wid = m.group(1)
-                    title = str(m.group(2) or "").strip().lower()
-                    w_idx = 3
-                else:
-                    m = rx_plain.search(line)
-                    if not m:
-                        continue
-                    wid = m.group(1)
-                    w_idx = 2
+            rx_window = _RX_TREE_WINDOW
+
+            # Candidates are (id, raw title bytes, w, h, x, y), produced lazily so the
+            # scan can stop at an unbeatable match; titles are decoded only for
+            # windows whose geometry can still win. The Xlib path reads EWMH client
+            # windows directly; xwininfo -tree is the fallback.
+            xconn = _XConn.get()
+            clients = xconn.client_titles() if xconn is not None else None
+            if clients is not None:
+                def iter_candidates():
+                    for wid, title in clients:
+                        geom = xconn.window_geometry(wid)
+                        if geom is None:
+                            continue
+                        yield hex(wid), title, geom["width"], geom["height"], geom["x"], geom["y"]
+            else:
+                if not _which("xwininfo"):
+                    return None
                 try:
-                    w = int(m.group(w_idx))
-                    h = int(m.group(w_idx + 1))
-                    x = int(m.group(w_idx + 2))
-                    y = int(m.group(w_idx + 3))
+                    proc = _run(["xwininfo", "-root", "-tree"], timeout=2.5)
+                    out = proc.stdout or b""
                 except Exception:
-                    continue
+                    return None
+                # id -> (indent, end offset) so the child pass can walk the same dump.
+                tree_pos = {}
+
+                def iter_candidates():
+                    # Matched on raw bytes; only ids and titles get decoded.
+                    for m in rx_window.finditer(out):
+                        wid = m.group("id").decode("ascii")
+                        tree_pos[wid] = (m.start("id") - m.start(), m.end())
+                        w, h, x, y = map(int, m.group("w", "h", "x", "y"))
+                        yield wid, m.group("title"), w, h, x, y
+
+            best_id = None
+            best_score = None
+            hint_tokens = [tok for tok in hint.split() if len(tok) >= 4][:4]
+            tok_rx = re.compile("|".join(map(re.escape, hint_tokens))) if hint_tokens else None
+            # Lowest score any window can reach: exact rect plus full title match.
+            score_floor = -90 if hint else 0
+            for wid, title_b, w, h, x, y in iter_candidates():
                 if w < 120 or h < 120:
                     continue
 
-                score = abs(x - tx) + abs(y - ty) + abs(w - tw) + abs(h - th)
+                # Geometry alone bounds the final score from below (score_floor is the
+                # best title bonus), so hopeless windows skip title work entirely.
+                score = abs(w - tw) + abs(h - th) + abs(x - tx) + abs(y - ty)
+                if best_score is not None and score + score_floor >= best_score:
+                    continue
                 if hint:
+                    title = title_b.decode("utf-8", "replace").strip().lower() if title_b else ""
                     if title and hint in title:
                         score -= 90
-                    elif title and any(tok in title for tok in hint_tokens):
+                    elif title and tok_rx is not None and tok_rx.search(title):
                         score -= 30
                     else:
                         score += 35
                 if best_score is None or score < best_score:
                     best_score = score
                     best_id = wid
+                    if best_score <= score_floor:
+                        break
 
             if not best_id:
                 return None
 
             # Resolve to the largest child window (usually the actual client area, no WM decorations).
-            try:
-                proc2 = subprocess.run(
-                    ["xwininfo", "-id", best_id, "-children"],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                    timeout=2.5,
-                )
-                out2 = proc2.stdout or ""
-            except Exception:
-                return best_id
+            children = []
+            if xconn is not None and clients is not None:
+                for cid, cw, ch in xconn.children_sizes(int(best_id, 16)) or []:
+                    children.append((hex(cid), cw, ch))
+            elif best_id in tree_pos:
+                # -tree nests children one indent level deeper right after their
+                # parent, so the direct children are already in `out`.
+                parent_indent, pos = tree_pos[best_id]
+                child_indent = None
+                for m in rx_window.finditer(out, pos):
+                    indent = m.start("id") - m.start()
+                    if indent <= parent_indent:
+                        break
+                    if child_indent is None:
+                        child_indent = indent
+                    if indent == child_indent:
+                        cw, ch = map(int, m.group("w", "h"))
+                        children.append((m.group("id").decode("ascii"), cw, ch))
 
             child_best_id = None
             child_best_area = 0
-            for line in out2.splitlines():
-                m = rx_with_title.search(line)
-                if m:
-                    cid = m.group(1)
-                    w_idx = 3
-                else:
-                    m = rx_plain.search(line)
-                    if not m:
-                        continue
-                    cid = m.group(1)
-                    w_idx = 2
-                try:
-                    cw = int(m.group(w_idx))
-                    ch = int(m.group(w_idx + 1))
-                except Exception:
-                    continue
+            for cid, cw, ch in children:
                 if cw < 200 or ch < 200:
                     continue
                 area = cw * ch
@@ -1621,28 +2592,47 @@ def main() -> int:
 
             return child_best_id or best_id
 
-        def _teacher_capture_rect(self, allow_focus_switch: bool = True):
-            fallback = (0, 0, TEACHER_CAM_WIDTH, TEACHER_CAM_HEIGHT)
-            rect = {"x": fallback[0], "y": fallback[1], "width": fallback[2], "height": fallback[3]}
+        def _finalize_capture_rect(self, prep, rect: dict, title_hint: str) -> dict:
+            """
+            Attach the X11 window id for rect and prefer that window's own geometry.
+            """
+            win_id = self._resolve_x11_capture_window_id_for_rect(rect, title_hint=title_hint)
+            if not win_id:
+                return rect
+            rect["window_id"] = win_id
+            try:
+                prep.window_xids_by_role["teacher"] = str(win_id)
+            except Exception:
+                pass
+            geom = self._x11_geometry_for_window_id(win_id)
+            if geom:
+                return self._normalize_capture_rect(geom, window_id=win_id)
+            return rect
+
+        def _teacher_capture_rect(self, allow_focus_switch: bool = True, force: bool = False):
+            # Blocks on WebDriver and X11 queries; only reached from the autostart
+            # thread and _run_bg workers, never from the Tk thread.
+            if force:
+                _subproc_cache.clear()
+            # Each branch builds exactly one result dict; the fallback rect is only
+            # materialized when a branch actually ends on it.
             title_hint = "akool"
+            prep = self._prepare_module()
             cached_window_id = None
             try:
-                from prepare import window_xids_by_role  # local import avoids startup cycles
-                cached_window_id = (window_xids_by_role or {}).get("teacher")
+                cached_window_id = (prep.window_xids_by_role or {}).get("teacher")
             except Exception:
                 cached_window_id = None
             if cached_window_id:
-                rect["window_id"] = str(cached_window_id)
+                # A vanished window reports no geometry; resolve afresh below.
                 geom = self._x11_geometry_for_window_id(cached_window_id)
-                if geom:
-                    n = self._normalize_capture_rect(geom)
-                    n["window_id"] = str(cached_window_id)
-                    return n
-                return rect
+                if geom is not None:
+                    return self._normalize_capture_rect(geom, window_id=cached_window_id)
 
             env = self.driver
             if env is None:
-                return rect
+                return self._normalize_capture_rect(None)
+            rect = None
 
             teacher_driver = getattr(env, "teacher_driver", None)
             if teacher_driver is not None:
@@ -1654,38 +2644,12 @@ def main() -> int:
                             title_hint = t
                     except Exception:
                         pass
-                    win_id = self._resolve_x11_capture_window_id_for_rect(rect, title_hint=title_hint)
-                    if win_id:
-                        rect["window_id"] = win_id
-                        try:
-                            from prepare import window_xids_by_role
-                            window_xids_by_role["teacher"] = str(win_id)
-                        except Exception:
-                            pass
-                        geom = self._x11_geometry_for_window_id(win_id)
-                        if geom:
-                            n = self._normalize_capture_rect(geom)
-                            n["window_id"] = str(win_id)
-                            return n
-                    return rect
+                    return self._finalize_capture_rect(prep, rect, title_hint)
                 except Exception:
                     pass
 
             if not allow_focus_switch:
-                win_id = self._resolve_x11_capture_window_id_for_rect(rect, title_hint=title_hint)
-                if win_id:
-                    rect["window_id"] = win_id
-                    try:
-                        from prepare import window_xids_by_role
-                        window_xids_by_role["teacher"] = str(win_id)
-                    except Exception:
-                        pass
-                    geom = self._x11_geometry_for_window_id(win_id)
-                    if geom:
-                        n = self._normalize_capture_rect(geom)
-                        n["window_id"] = str(win_id)
-                        return n
-                return rect
+                return self._finalize_capture_rect(prep, rect or self._normalize_capture_rect(None), title_hint)
 
             main_driver = getattr(env, "main_driver", env)
             prev_handle = None
@@ -1695,8 +2659,7 @@ def main() -> int:
             except Exception:
                 prev_handle = None
             try:
-                from prepare import window_handles_by_role  # local import avoids startup cycles
-                target_handle = (window_handles_by_role or {}).get("teacher")
+                target_handle = (prep.window_handles_by_role or {}).get("teacher")
                 if target_handle:
                     main_driver.switch_to.window(target_handle)
                     try:
@@ -1706,20 +2669,7 @@ def main() -> int:
                     except Exception:
                         pass
                     rect = self._normalize_capture_rect(main_driver.get_window_rect())
-                    win_id = self._resolve_x11_capture_window_id_for_rect(rect, title_hint=title_hint)
-                    if win_id:
-                        rect["window_id"] = win_id
-                        try:
-                            from prepare import window_xids_by_role
-                            window_xids_by_role["teacher"] = str(win_id)
-                        except Exception:
-                            pass
-                        geom = self._x11_geometry_for_window_id(win_id)
-                        if geom:
-                            n = self._normalize_capture_rect(geom)
-                            n["window_id"] = str(win_id)
-                            return n
-                    return rect
+                    return self._finalize_capture_rect(prep, rect, title_hint)
             except Exception:
                 pass
             finally:
@@ -1729,20 +2679,7 @@ def main() -> int:
                     except Exception:
                         pass
 
-            win_id = self._resolve_x11_capture_window_id_for_rect(rect, title_hint=title_hint)
-            if win_id:
-                rect["window_id"] = win_id
-                try:
-                    from prepare import window_xids_by_role
-                    window_xids_by_role["teacher"] = str(win_id)
-                except Exception:
-                    pass
-                geom = self._x11_geometry_for_window_id(win_id)
-                if geom:
-                    n = self._normalize_capture_rect(geom)
-                    n["window_id"] = str(win_id)
-                    return n
-            return rect
+            return self._finalize_capture_rect(prep, rect or self._normalize_capture_rect(None), title_hint)
 
         def _start_teacher_media_blocking(self, source: str = "manual", capture_rect: dict | None = None):
             if not TEACHER_CAM_ENABLED:
@@ -1752,7 +2689,9 @@ def main() -> int:
                 self.log("Teacher media bridge is unavailable.", "ERROR")
                 return False
 
-            capture_rect = capture_rect if isinstance(capture_rect, dict) else self._teacher_capture_rect()
+            if not isinstance(capture_rect, dict):
+                # A user-initiated start re-reads X11 state instead of trusting the TTL cache.
+                capture_rect = self._teacher_capture_rect(force=(source == "manual"))
             win_id = capture_rect.get("window_id") if isinstance(capture_rect, dict) else None
             win_id_note = f" window_id={win_id}" if win_id else ""
             self.log(
@@ -1762,27 +2701,24 @@ def main() -> int:
                 f"fps={TEACHER_CAM_FPS}{win_id_note}"
             )
             try:
-                with self._teacher_media_op_lock:
-                    result = self._teacher_bridge.start(capture_rect)
+                result = self._run_teacher_bridge_op(self._teacher_bridge.start, capture_rect)
             except Exception as exc:
                 self.teacher_media_status.set(f"error: {exc}")
                 self.log(f"Teacher media error: {exc}", "ERROR")
                 return False
 
-            status = result.get("status") if isinstance(result, dict) else {}
-            self._teacher_bridge_last_status = status if isinstance(status, dict) else {}
-            self.teacher_media_status.set(self._teacher_status_text(self._teacher_bridge_last_status))
+            status = self._publish_teacher_status(result.get("status") if isinstance(result, dict) else {})
             if result.get("ok"):
                 self.log(
                     "Teacher media ready "
-                    f"dev={self._teacher_bridge_last_status.get('cam_device')} "
-                    f"sink={self._teacher_bridge_last_status.get('sink_name')} "
-                    f"source={self._teacher_bridge_last_status.get('source_name')}"
+                    f"dev={status.get('cam_device')} "
+                    f"sink={status.get('sink_name')} "
+                    f"source={status.get('source_name')}"
                 )
-                self.log(f"Teacher ffmpeg: {_compact_text(self._teacher_bridge_last_status.get('ffmpeg_cmd') or '', 320)}")
+                self.log(f"Teacher ffmpeg: {_compact_text(status.get('ffmpeg_cmd') or '', 320)}")
                 return True
             else:
-                err = result.get("error") or self._teacher_bridge_last_status.get("last_error") or "unknown_error"
+                err = result.get("error") or status.get("last_error") or "unknown_error"
                 self.log(f"Teacher media error: {err}", "ERROR")
                 return False
 
@@ -1791,15 +2727,12 @@ def main() -> int:
                 return
             self.log(f"Teacher media stop requested. source={source}")
             try:
-                with self._teacher_media_op_lock:
-                    result = self._teacher_bridge.stop()
+                result = self._run_teacher_bridge_op(self._teacher_bridge.stop)
             except Exception as exc:
                 self.teacher_media_status.set(f"error: {exc}")
                 self.log(f"Teacher media stop failed: {exc}", "ERROR")
                 return
-            status = result.get("status") if isinstance(result, dict) else {}
-            self._teacher_bridge_last_status = status if isinstance(status, dict) else {}
-            self.teacher_media_status.set(self._teacher_status_text(self._teacher_bridge_last_status))
+            self._publish_teacher_status(result.get("status") if isinstance(result, dict) else {})
             self.log("Teacher media stopped.")
 
         def _tick(self):
@@ -1811,7 +2744,7 @@ def main() -> int:
 
             try:
                 p = self.server.proc
-                if p and p.poll() is None:
+                if p and self.server.alive():
                     self.server_status.set(f"running (pid {p.pid})")
                 else:
                     self.server_status.set("stopped")
@@ -1821,20 +2754,46 @@ def main() -> int:
             self.selenium_status.set("running" if self.driver is not None else "stopped")
             self._poll_teacher_bridge_status(force=False)
 
+            state = (
+                self.server_status.get(),
+                self.port_status.get(),
+                self.selenium_status.get(),
+                self.teacher_media_status.get(),
+            )
+            changed = state != self._tick_last_state
+            self._tick_last_state = state
+            self._tick_interval_ms = _next_poll_interval(self._tick_interval_ms, LAUNCHER_TICK_INTERVAL_MS, changed)
             try:
-                self.root.after(LAUNCHER_TICK_INTERVAL_MS, self._tick)
+                if self._tick_after_id is not None:
+                    self.root.after_cancel(self._tick_after_id)
+                self._tick_after_id = self.root.after(self._tick_interval_ms, self._tick)
             except Exception:
                 pass
 
-        def _signal_handler(self, *_args):
-            self.log("Signal received, shutting down...", "WARN")
+        def _wake_tick(self):
+            self._tick_interval_ms = LAUNCHER_TICK_INTERVAL_MS
             try:
-                self.stop_all()
-            finally:
+                self.root.after(0, self._tick)
+            except Exception:
+                pass
+
+        def _shutdown_signal_poll(self):
+            # Tk's C mainloop only yields to Python on events; this short poll
+            # bounds how long a SIGINT/SIGTERM waits before shutdown starts.
+            if _SHUTDOWN_SIGNAL.is_set():
+                self.log("Signal received, shutting down...", "WARN")
                 try:
-                    self.root.destroy()
+                    self.on_close()
                 except Exception:
-                    pass
+                    try:
+                        self.root.destroy()
+                    except Exception:
+                        pass
+                return
+            try:
+                self.root.after(SHUTDOWN_SIGNAL_POLL_MS, self._shutdown_signal_poll)
+            except Exception:
+                pass
 
         def _atexit_cleanup(self):
             try:
@@ -1849,7 +2808,7 @@ def main() -> int:
 
         def _start_router_blocking(self):
             if is_tcp_port_open(ROUTER_HOST, ROUTER_PORT):
-                managed_running = bool(self.server.proc and self.server.proc.poll() is None)
+                managed_running = self.server.alive()
                 has_walkie = self._router_supports_walkie()
                 if has_walkie:
                     self.log(f"Router already listening on {ROUTER_HOST}:{ROUTER_PORT} (skipping start).")
@@ -1869,48 +2828,70 @@ def main() -> int:
                         return
 
             self.log("Starting router server (route.py)...")
+            self._walkie_supported = None
+            # Keep this Popen free of preexec_fn/user/group/session options: that
+            # lets CPython (>= 3.10) spawn via vfork instead of copying the GUI's
+            # address space with fork.
             proc = subprocess.Popen(
                 [sys.executable, "-u", os.path.join(BASE_DIR, "route.py")],
                 cwd=BASE_DIR,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
+                bufsize=0,
             )
-            self.server.proc = proc
+            self.server.attach(proc)
+
+            def emit(line: bytes):
+                formatted = _format_route_log_line(line)
+                if formatted:
+                    lvl, msg = formatted
+                    self.log(msg, lvl)
+                else:
+                    self.log(line.decode("utf-8", "replace"), "ROUTER")
 
             def drain():
+                # Raw pipe reads in 64 KiB chunks, split on b"\n"; only lines
+                # that are logged verbatim get decoded.
+                buf = bytearray()
                 try:
-                    for line in proc.stdout:
-                        raw = line.rstrip("\n")
-                        formatted = _format_route_log_line(raw)
-                        if formatted:
-                            lvl, msg = formatted
-                            self.log(msg, lvl)
-                        else:
-                            self.log(raw, "ROUTER")
+                    while True:
+                        chunk = proc.stdout.read(65536)
+                        if not chunk:
+                            break
+                        buf += chunk
+                        start = 0
+                        while True:
+                            nl = buf.find(b"\n", start)
+                            if nl < 0:
+                                break
+                            emit(bytes(buf[start:nl]).rstrip(b"\r"))
+                            start = nl + 1
+                        if start:
+                            del buf[:start]
+                    if buf:
+                        emit(bytes(buf).rstrip(b"\r"))
                 except Exception:
                     pass
+                finally:
+                    # stdout EOF means the router exited; update status now instead
+                    # of waiting out a backed-off tick.
+                    self._wake_tick()
 
             t = threading.Thread(target=drain, daemon=True)
             t.start()
             self.server.reader_thread = t
 
-            deadline = time.time() + 6.0
-            while time.time() < deadline:
-                if is_tcp_port_open(ROUTER_HOST, ROUTER_PORT):
-                    self.log("Router is up.")
-                    return
-                if proc.poll() is not None:
-                    self.log("Router exited early. Check logs above.", "ERROR")
-                    return
-                time.sleep(0.2)
-
-            self.log("Router did not open port in time (still may be starting).", "WARN")
+            up = _wait_port_or_exit(proc, ROUTER_HOST, ROUTER_PORT, 6.0)
+            if up:
+                self.log("Router is up.")
+            elif up is False:
+                self.log("Router exited early. Check logs above.", "ERROR")
+            else:
+                self.log("Router did not open port in time (still may be starting).", "WARN")
 
         def _stop_router_blocking(self):
-            proc = self.server.proc
-            self.server.proc = None
+            proc = self.server.detach()
+            self._walkie_supported = None
             if not proc:
                 if is_tcp_port_open(ROUTER_HOST, ROUTER_PORT):
                     self.log(f"Port {ROUTER_PORT} is open but no managed router process exists. Trying to stop listener...", "WARN")
@@ -1935,6 +2916,7 @@ def main() -> int:
                 return
 
             self.log("Starting Selenium environment (prepare.py)...")
+            _subproc_cache.clear()
             try:
                 self._cancel_teacher_autostart(reason="start_selenium")
                 ok_floor, count_floor, detail_floor = _ensure_static_workspace_floor(MIN_WORKSPACE_FLOOR)
@@ -1979,6 +2961,7 @@ def main() -> int:
 
             driver = self.driver
             self.driver = None
+            _subproc_cache.clear()
             if driver is None:
                 return
 
@@ -2016,7 +2999,7 @@ def main() -> int:
                 except Exception as exc:
                     self.log(f"{label} failed: {exc}", "ERROR")
                 finally:
-                    self._tick()
+                    self._wake_tick()
 
             threading.Thread(target=worker, daemon=True).start()
 
@@ -2064,6 +3047,9 @@ def main() -> int:
 
         def on_close(self):
             self.log("Closing window. Shutting down...", "WARN")
+            self._pipeline_stream_stop.set()
+            self._bg_executor.shutdown(wait=False, cancel_futures=True)
+            self._close_router_conns()
             self._cancel_teacher_autostart(reason="on_close")
             try:
                 self._stop_selenium_blocking()
@@ -2075,6 +3061,7 @@ def main() -> int:
                 pass
             self.root.destroy()
 
+    _install_shutdown_signals()
     root = tk.Tk()
     App(root)
     root.mainloop()
@@ -0,0 +1,135 @@
+"""
+Local TCP probes shared by launcher_gui.py and prepare.py:
+procfs listener lookups and a non-blocking port check.
+"""
+
+from __future__ import annotations
+
+import errno
+import os
+import select
+import socket
+import struct
+
+
+_LINGER_RESET = struct.pack("ii", 1, 0)
+_PROC_NET_TCP = ("/proc/net/tcp", "/proc/net/tcp6")
+# Listen addresses (procfs hex, either byte order) that accept an IPv4 loopback
+# connect: 0.0.0.0, 127.0.0.1, dual-stack :: and ::ffff:127.0.0.1.
+_LOOPBACK_LISTEN_ADDRS = frozenset((
+    b"00000000", b"0100007F", b"7F000001",
+    b"00000000000000000000000000000000",
+    b"0000000000000000FFFF00000100007F", b"00000000000000000000FFFF7F000001",
+))
+_LOOPBACK_HOSTS = frozenset(("127.0.0.1", "localhost"))
+
+
+def proc_tcp_listeners(port: int):
+    """
+    [(local addr hex, socket inode)] for LISTEN sockets on port, from procfs.
+    Returns None when /proc/net/tcp is unavailable.
+    """
+    needle = b":%04X " % int(port)
+    found = None
+    for path in _PROC_NET_TCP:
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            continue
+        if found is None:
+            found = []
+        if needle not in data:
+            continue
+        for line in data.splitlines()[1:]:
+            # sl local_address rem_address st tx:rx tr:when retrnsmt uid timeout inode
+            parts = line.split(None, 10)
+            if len(parts) < 10 or parts[3] != b"0A":
+                continue
+            addr, _sep, lport = parts[1].rpartition(b":")
+            if int(lport, 16) == int(port):
+                found.append((addr, int(parts[9])))
+    return found
+
+
+def tcp_listener_exists(port: int) -> bool | None:
+    """
+    Whether a loopback-reachable socket is LISTENing on port, read from procfs.
+    Returns None when /proc/net/tcp is unavailable so callers can probe instead.
+    """
+    listeners = proc_tcp_listeners(port)
+    if listeners is None:
+        return None
+    return any(addr in _LOOPBACK_LISTEN_ADDRS for addr, _inode in listeners)
+
+
+def pids_owning_inodes(inodes) -> set[int]:
+    targets = {f"socket:[{inode}]" for inode in inodes}
+    pids = set()
+    try:
+        procs = os.scandir("/proc")
+    except OSError:
+        return pids
+    with procs:
+        for entry in procs:
+            if not entry.name.isdigit():
+                continue
+            try:
+                with os.scandir(f"/proc/{entry.name}/fd") as fds:
+                    for fd in fds:
+                        try:
+                            if os.readlink(fd.path) in targets:
+                                pids.add(int(entry.name))
+                                break
+                        except OSError:
+                            continue
+            except OSError:
+                continue  # exited, or another user's process
+    return pids
+
+
+def procfs_listening_pids(port: int):
+    """
+    Sorted PIDs owning LISTEN sockets on port. Returns None when procfs can't
+    answer (unavailable, or sockets owned by processes we can't inspect) so
+    callers fall back to lsof/fuser.
+    """
+    listeners = proc_tcp_listeners(port)
+    if listeners is None:
+        return None
+    if not listeners:
+        return []
+    pids = pids_owning_inodes(inode for _addr, inode in listeners)
+    return sorted(pids) if pids else None
+
+
+def is_tcp_port_open(host: str, port: int, timeout: float = 0.25) -> bool:
+    if host in _LOOPBACK_HOSTS:
+        # Local checks read the kernel's socket table: no handshake, no fd
+        # churn in polling loops.
+        listening = tcp_listener_exists(port)
+        if listening is not None:
+            return listening
+    # Non-blocking connect + select: a refused port returns immediately and a
+    # filtered one costs at most `timeout`, never a full SYN retry cycle.
+    try:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    except OSError:
+        return False
+    try:
+        sock.setblocking(False)
+        err = sock.connect_ex((host, int(port)))
+        if err in (errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY):
+            _r, writable, _x = select.select([], [sock], [], max(0.0, float(timeout)))
+            if not writable:
+                return False
+            err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        if err == 0:
+            # RST on close so frequent localhost probes leave no TIME_WAIT.
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _LINGER_RESET)
+            return True
+        return False
+    except OSError:
+        return False
+    finally:
+        sock.close()
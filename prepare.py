@@ -2,7 +2,6 @@ from config import (
     AUDIO_SEGMENT_SECONDS,
     AUTOLOAD_EXTENSION,
     CHROMEDRIVER_PATH,
-    CHROME_BIN_CANDIDATES,
     CHROME_EXTRA_FLAGS,
     CHROME_STARTUP_WAIT,
     CHROME_USER_DATA_ROOT,
@@ -32,22 +31,26 @@ from config import (
     TEACHER_PULSE_SOURCE,
     TEACHER_USE_SEPARATE_PROFILE,
     URLS,
+    WINDOW_NAMES,
     WINDOW_OPEN_DELAY,
     WINDOW_POSITION_DELAY,
+    resolve_chrome_bin,
 )
 
 import json
 import os
 import re
+import select
 import shutil
 import signal
-import socket
 import subprocess
 import time
 import urllib.request
+from netprobe import is_tcp_port_open, procfs_listening_pids
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.remote.command import Command
 
 try:
     from teacher_media_bridge import ensure_pulse_sink_and_source
@@ -56,20 +59,10 @@ except Exception:
 
 
 # page mappings
-window_handles_by_role = {
-    "teacher": None,
-    "stt": None,
-    "ai": None,
-    "class": None
-}
+window_handles_by_role = dict.fromkeys(WINDOW_NAMES)
 
 # Best-effort X11 window IDs captured per role.
-window_xids_by_role = {
-    "teacher": None,
-    "stt": None,
-    "ai": None,
-    "class": None,
-}
+window_xids_by_role = dict.fromkeys(WINDOW_NAMES)
 
 # Tab placement: Ubuntu-style snap layout for 3 tabs:
 # left half + right-top + right-bottom.
@@ -104,8 +97,25 @@ ROLE_LAYOUT_STATE_PATH = os.path.join(
     ".runtime",
     "role_window_layout.json",
 )
+# chromedriver resolved by Selenium Manager on an earlier run; reused so
+# later connects skip the resolver subprocess.
+CHROMEDRIVER_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    ".runtime",
+    "chromedriver_path.json",
+)
 _workspace_policy_restore = None
 
+_RX_WMCTRL_WORKAREA = re.compile(r"WA:\s*(-?\d+),(-?\d+)\s+(\d+)x(\d+)", re.IGNORECASE)
+_RX_XPROP_DESKTOPS = re.compile(r"_NET_NUMBER_OF_DESKTOPS\(CARDINAL\)\s*=\s*(\d+)")
+_RX_NET_WM_STATE = re.compile(r"_NET_WM_STATE_[A-Z_]+")
+# Example xwininfo -tree line:
+# 0x4e00007 "Title": ("google-chrome" "Google-chrome")  960x540+0+0  +0+0
+_RX_XWININFO_TREE_GEOM = re.compile(
+    r"^\s*(0x[0-9a-f]+)\s+.*?\s+(\d+)x(\d+)\+(-?\d+)\+(-?\d+)\s",
+    re.IGNORECASE,
+)
+
 
 def _reset_role_window_handles():
     for key in list(window_handles_by_role.keys()):
@@ -424,23 +434,49 @@ class LaunchedEnvironment:
             print("[prepare] environment quit warnings:", " | ".join(errors))
 
 
-def resolve_chrome_binary():
-    for name in CHROME_BIN_CANDIDATES:
-        path = shutil.which(name) or (name if os.path.exists(name) else None)
-        if path:
-            return path
-    return None
+# Last resolved Chrome binary, reused across runs after a single X_OK check.
+CHROME_BIN_CACHE_PATH = os.path.expanduser("~/.cache/teacher/chrome_bin")
 
 
-def is_tcp_port_open(host, port, timeout=0.3):
+def resolve_chrome_binary():
+    """
+    The bundled CfT binary still wins; otherwise reuse the path cached by an
+    earlier run while it stays executable, and probe CHROME_BIN_CANDIDATES
+    only when it does not.
+    """
+    if os.access(LOCAL_CFT_CHROME_BIN, os.X_OK):
+        return LOCAL_CFT_CHROME_BIN
     try:
-        with socket.create_connection((host, port), timeout=timeout):
-            return True
-    except Exception:
-        return False
+        with open(CHROME_BIN_CACHE_PATH, "r", encoding="utf-8") as fh:
+            cached = fh.read().strip()
+    except OSError:
+        cached = ""
+    if cached and os.access(cached, os.X_OK):
+        return cached
+
+    path = resolve_chrome_bin()
+    if path:
+        try:
+            os.makedirs(os.path.dirname(CHROME_BIN_CACHE_PATH), exist_ok=True)
+            with open(CHROME_BIN_CACHE_PATH, "w", encoding="utf-8") as fh:
+                fh.write(path)
+        except OSError:
+            pass
+    return path
+
+
+def _port_poll_delays():
+    """Readiness poll schedule: fine-grained while Chrome usually comes up, then coarser."""
+    for delay in (0.002,) * 20 + (0.02,) * 25:
+        yield delay
+    while True:
+        yield 0.1
 
 
 def _listening_pids_for_port(port):
+    found = procfs_listening_pids(port)
+    if found is not None:
+        return found
     pids = set()
     checks = [
         ["lsof", "-t", "-i", f"TCP:{port}", "-sTCP:LISTEN"],
@@ -626,21 +662,25 @@ def terminate_debug_port_owner(port, timeout_s=4.0):
 
     for pid in pids:
         try:
-            os.kill(pid, 15)  # SIGTERM
+            os.kill(pid, signal.SIGTERM)
         except Exception:
             pass
 
+    # Chrome usually exits within a few tens of ms of SIGTERM; start polling
+    # fine and back off instead of a flat 150 ms step.
     deadline = time.time() + max(0.1, float(timeout_s))
+    delay = 0.005
     while time.time() < deadline:
-        if not is_tcp_port_open("127.0.0.1", port):
+        if not any(os.path.exists(f"/proc/{pid}") for pid in pids) or not is_tcp_port_open("127.0.0.1", port):
             return True
-        time.sleep(0.15)
+        time.sleep(delay)
+        delay = min(0.15, delay * 2)
 
     # Last resort
     pids = _listening_pids_for_port(port)
     for pid in pids:
         try:
-            os.kill(pid, 9)  # SIGKILL
+            os.kill(pid, signal.SIGKILL)
         except Exception:
             pass
 
@@ -657,6 +697,27 @@ def _fetch_debug_targets(debug_port, timeout=0.8):
         return []
 
 
+def wait_devtools_ready(debug_port, timeout_s=CHROME_STARTUP_WAIT):
+    """
+    Wait until the DevTools HTTP endpoint answers /json/version, i.e. the
+    browser accepts CDP sessions. Returns False after timeout_s.
+    """
+    url = f"http://127.0.0.1:{debug_port}/json/version"
+    deadline = time.time() + max(0.05, float(timeout_s))
+    delay = 0.005
+    while True:
+        try:
+            with urllib.request.urlopen(url, timeout=0.2) as resp:
+                if resp.status == 200:
+                    return True
+        except Exception:
+            pass
+        if time.time() >= deadline:
+            return False
+        time.sleep(delay)
+        delay = min(0.05, delay * 2)
+
+
 def wait_for_extension_target(debug_port, timeout_s=4.0):
     deadline = time.time() + max(0.5, float(timeout_s))
     while time.time() < deadline:
@@ -733,11 +794,30 @@ def launch_chrome_with_debug(
         f"profile={user_data_dir}/{profile_dir} "
         f"extension={'on' if AUTOLOAD_EXTENSION and EXTENSION_DIR else 'off'}"
     )
-    subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=env)
+    # close_fds=False with an absolute binary path lets CPython launch via
+    # posix_spawn (vfork-style, no fd sweep) while Popen still reaps Chrome.
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=env, close_fds=False)
+    # Sleep between port probes on Chrome's pidfd so a crash on startup ends
+    # the wait at once instead of after the full deadline.
+    pidfd = None
+    if hasattr(os, "pidfd_open"):
+        try:
+            pidfd = os.pidfd_open(proc.pid)
+        except OSError:
+            pidfd = None
+    try:
+        return _wait_chrome_debug_port(proc, pidfd, debug_port, label)
+    finally:
+        if pidfd is not None:
+            os.close(pidfd)
+
 
+def _wait_chrome_debug_port(proc, pidfd, debug_port, label):
     deadline = time.time() + 12
-    while time.time() < deadline:
-        if is_tcp_port_open("127.0.0.1", debug_port):
+    for delay in _port_poll_delays():
+        if time.time() >= deadline:
+            break
+        if is_tcp_port_open("127.0.0.1", debug_port, timeout=0.05):
             if AUTOLOAD_EXTENSION and EXTENSION_DIR:
                 if wait_for_extension_target(debug_port, timeout_s=3.5):
                     print(f"[prepare] {label}: extension target detected on :{debug_port}.")
@@ -759,21 +839,91 @@ def launch_chrome_with_debug(
                         f"seen_extension_targets={ext_urls}{cft_hint}"
                     )
             return True
-        time.sleep(0.3)
+        if proc.poll() is not None:
+            if proc.returncode != 0:
+                print(f"[prepare] {label}: chrome exited during startup (code={proc.returncode}).")
+                return False
+            # Exit 0: handed off to an already running browser; keep probing.
+            pidfd = None
+        if pidfd is None:
+            time.sleep(delay)
+        else:
+            select.select([pidfd], [], [], delay)
 
     print(f"[prepare] {label}: debug port {debug_port} failed to open.")
     return False
 
 
+def _load_cached_chromedriver_path():
+    try:
+        with open(CHROMEDRIVER_CACHE_PATH, "r", encoding="utf-8") as fh:
+            path = str(json.load(fh).get("path") or "")
+    except Exception:
+        return None
+    if path and os.path.isfile(path) and os.access(path, os.X_OK):
+        return path
+    return None
+
+
+def _save_cached_chromedriver_path(driver):
+    try:
+        path = str(driver.service.path or "")
+    except Exception:
+        return
+    if not path or not os.path.isfile(path):
+        return
+    try:
+        os.makedirs(os.path.dirname(CHROMEDRIVER_CACHE_PATH), exist_ok=True)
+        with open(CHROMEDRIVER_CACHE_PATH, "w", encoding="utf-8") as fh:
+            json.dump({"path": path}, fh)
+    except Exception:
+        pass
+
+
+def _widen_webdriver_pool(driver, maxsize=16):
+    """
+    Selenium's keep-alive PoolManager holds one connection per host, so
+    overlapping commands open and drop extra sockets ("connection pool is
+    full"). Widen it; the pool is rebuilt on the next command.
+    """
+    conn = getattr(getattr(driver, "command_executor", None), "_conn", None)
+    pool_kw = getattr(conn, "connection_pool_kw", None)
+    if not isinstance(pool_kw, dict):
+        return
+    try:
+        pool_kw["maxsize"] = int(maxsize)
+        pool_kw["block"] = False
+        conn.clear()
+    except Exception:
+        pass
+
+
+def _new_chrome_driver(opts, service=None):
+    if service is None:
+        driver = webdriver.Chrome(options=opts)
+    else:
+        driver = webdriver.Chrome(service=service, options=opts)
+    _widen_webdriver_pool(driver)
+    return driver
+
+
 def connect_webdriver(debug_addr):
     opts = Options()
     opts.add_experimental_option("debuggerAddress", debug_addr)
     if CHROMEDRIVER_PATH:
         service = Service(CHROMEDRIVER_PATH)
         try:
-            return webdriver.Chrome(service=service, options=opts)
+            return _new_chrome_driver(opts, service=service)
         except Exception as exc:
             print(f"ChromeDriver at {CHROMEDRIVER_PATH} failed ({exc}); falling back to Selenium Manager.")
+    else:
+        cached = _load_cached_chromedriver_path()
+        if cached:
+            try:
+                return _new_chrome_driver(opts, service=Service(cached))
+            except Exception as exc:
+                # Usually a Chrome update left the cached driver behind.
+                print(f"Cached ChromeDriver {cached} failed ({exc}); re-resolving via Selenium Manager.")
 
     original_path = os.environ.get("PATH", "")
     path_parts = original_path.split(os.pathsep) if original_path else []
@@ -782,9 +932,12 @@ def connect_webdriver(debug_addr):
         os.environ["PATH"] = os.pathsep.join(filtered_parts)
         print("Ignoring chromedriver in PATH to let Selenium Manager fetch a compatible version.")
     try:
-        return webdriver.Chrome(options=opts)
+        driver = _new_chrome_driver(opts)
     finally:
         os.environ["PATH"] = original_path
+    if not CHROMEDRIVER_PATH:
+        _save_cached_chromedriver_path(driver)
+    return driver
 
 
 def _collapse_to_single_window(driver, label="chrome"):
@@ -864,9 +1017,12 @@ def _open_new_window_handle(driver):
         before = []
     before_set = set(before)
 
+    # Handles come from the command replies / handle diff below, never from
+    # an extra current_window_handle round trip.
     try:
-        driver.switch_to.new_window("window")
-        return driver.current_window_handle, "selenium_new_window"
+        handle = driver.execute(Command.NEW_WINDOW, {"type": "window"})["value"]["handle"]
+        driver.switch_to.window(handle)
+        return handle, "selenium_new_window"
     except Exception:
         pass
 
@@ -881,7 +1037,7 @@ def _open_new_window_handle(driver):
             new_handles = [h for h in handles if h not in before_set]
             if new_handles:
                 driver.switch_to.window(new_handles[-1])
-                return driver.current_window_handle, "cdp_new_window"
+                return new_handles[-1], "cdp_new_window"
             time.sleep(0.08)
     except Exception:
         pass
@@ -899,7 +1055,7 @@ def _open_new_window_handle(driver):
             new_handles = [h for h in handles if h not in before_set]
             if new_handles:
                 driver.switch_to.window(new_handles[-1])
-                return driver.current_window_handle, "window_open_popup"
+                return new_handles[-1], "window_open_popup"
             time.sleep(0.08)
     except Exception:
         pass
@@ -912,6 +1068,7 @@ def _open_new_window_handle(driver):
                 [chrome_bin, "--new-window", "about:blank"],
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
+                close_fds=False,
             )
             deadline = time.time() + 2.5
             while time.time() < deadline:
@@ -922,7 +1079,7 @@ def _open_new_window_handle(driver):
                 new_handles = [h for h in handles if h not in before_set]
                 if new_handles:
                     driver.switch_to.window(new_handles[-1])
-                    return driver.current_window_handle, "chrome_cli_new_window"
+                    return new_handles[-1], "chrome_cli_new_window"
                 time.sleep(0.08)
     except Exception:
         pass
@@ -932,9 +1089,9 @@ def _open_new_window_handle(driver):
 
 def _open_role_page(driver, role, url, use_current_window=False):
     if use_current_window:
-        driver.switch_to.window(driver.window_handles[0])
+        current_handle = driver.window_handles[0]
+        driver.switch_to.window(current_handle)
         driver.get(url)
-        current_handle = driver.current_window_handle
         window_handles_by_role[role] = current_handle
         try:
             print(f"[prepare] opened role={role} target={url} actual={driver.current_url}")
@@ -947,21 +1104,26 @@ def _open_role_page(driver, role, url, use_current_window=False):
     if not handle:
         try:
             driver.execute_script("window.open('about:blank', '_blank');")
-            driver.switch_to.window(driver.window_handles[-1])
+            handle = driver.window_handles[-1]
+            driver.switch_to.window(handle)
             method = "tab_fallback"
         except Exception:
+            handle = None
             method = "failed"
     if not handle and method == "failed":
         try:
-            if driver.window_handles:
-                driver.switch_to.window(driver.window_handles[-1])
+            handles = driver.window_handles
+            if handles:
+                handle = handles[-1]
+                driver.switch_to.window(handle)
                 method = "last_window_fallback"
         except Exception:
             pass
     driver.get(url)
 
-    current_handle = driver.current_window_handle
-    window_handles_by_role[role] = current_handle
+    if not handle:
+        handle = driver.current_window_handle
+    window_handles_by_role[role] = handle
     try:
         print(
             f"[prepare] opened role={role} target={url} "
@@ -1032,6 +1194,9 @@ def _open_roles_staged_in_main_profile(main_driver, base_workspace=None):
         elif base_workspace is not None:
             _wmctrl_switch_workspace(base_workspace)
         use_current = idx == 0
+        # Blocking get() on purpose: each window is moved right after it opens,
+        # and its X11 id is told apart from same-geometry siblings by the loaded
+        # page title. open_main_pages' overlapped CDP opens can't serve this.
         _open_role_page(
             main_driver,
             role,
@@ -1128,23 +1293,105 @@ def _open_roles_staged_in_main_profile(main_driver, base_workspace=None):
         _flow_breath(f"post-open role={role}")
 
 
-def open_main_pages(driver, include_teacher=True, include_class=False, include_stt=False):
-    if include_teacher:
-        _open_role_page(driver, "teacher", URLS["akool"], use_current_window=True)
-        time.sleep(WINDOW_OPEN_DELAY)
-        _open_role_page(driver, "ai", URLS["chatgpt"], use_current_window=False)
-        time.sleep(WINDOW_OPEN_DELAY)
-    else:
-        _open_role_page(driver, "ai", URLS["chatgpt"], use_current_window=True)
-        time.sleep(WINDOW_OPEN_DELAY)
+def _open_role_windows_via_cdp(driver, role_urls):
+    """
+    Open each (role, url) in its own window with one CDP round trip apiece.
+    createTarget returns once the target exists, without waiting for the page
+    load; chromedriver window handles are the CDP target ids.
+    Returns the (role, url) pairs that could not be opened this way.
+    """
+    failed = []
+    for role, url in role_urls:
+        try:
+            res = driver.execute_cdp_cmd("Target.createTarget", {"url": url, "newWindow": True})
+            target_id = str((res or {}).get("targetId") or "")
+        except Exception as e:
+            print(f"[prepare] cdp open failed role={role}: {e}")
+            failed.append((role, url))
+            continue
+        if not target_id:
+            failed.append((role, url))
+            continue
+        window_handles_by_role[role] = target_id
+        print(f"[prepare] opened role={role} target={url} method=cdp_create_target")
+
+    try:
+        handles = set(driver.window_handles)
+    except Exception:
+        handles = set()
+    for role, _url in role_urls:
+        handle = window_handles_by_role.get(role)
+        if handle and handles and handle not in handles:
+            print(f"[prepare] role handle warning: role={role} target {handle} not in window handles.")
+    return failed
+
+
+def _navigate_first_window_via_cdp(driver, role, url):
+    """
+    Point the first window at url with Page.navigate, which returns once the
+    navigation starts rather than at the load event.
+    """
+    try:
+        handle = driver.window_handles[0]
+        driver.switch_to.window(handle)
+        res = driver.execute_cdp_cmd("Page.navigate", {"url": url})
+    except Exception as e:
+        print(f"[prepare] cdp navigate failed role={role}: {e}")
+        return False
+    if (res or {}).get("errorText"):
+        print(f"[prepare] cdp navigate failed role={role}: {res.get('errorText')}")
+        return False
+    window_handles_by_role[role] = handle
+    print(f"[prepare] opened role={role} target={url} method=cdp_navigate")
+    return True
 
-    if include_class:
-        _open_role_page(driver, "class", URLS["nativecamp"], use_current_window=False)
-        time.sleep(WINDOW_OPEN_DELAY)
 
+def _wait_role_pages_loaded(driver, roles, timeout_s=20.0):
+    """
+    Fan-in for pages opened without waiting on load: poll every pending role
+    window each pass until its document is complete or the overall timeout
+    ends, so one slow page can't starve the others of checks.
+    """
+    pending = [role for role in roles if window_handles_by_role.get(role)]
+    deadline = time.time() + max(0.5, float(timeout_s))
+    delay = 0.05
+    while pending:
+        still = []
+        for role in pending:
+            try:
+                driver.switch_to.window(window_handles_by_role.get(role))
+                state = driver.execute_script("return document.readyState")
+            except Exception:
+                continue
+            if state != "complete":
+                still.append(role)
+        pending = still
+        if not pending:
+            return True
+        if time.time() >= deadline:
+            print(f"[prepare] page load wait timed out; not complete: {pending}")
+            return False
+        time.sleep(delay)
+        delay = min(0.25, delay * 2)
+    return True
+
+
+def open_main_pages(driver, include_teacher=True, include_class=False, include_stt=False):
+    role_urls = [("teacher", URLS["akool"]), ("ai", URLS["chatgpt"])]
+    if not include_teacher:
+        role_urls = role_urls[1:]
+    if include_class:
+        role_urls.append(("class", URLS["nativecamp"]))
     if include_stt:
-        _open_role_page(driver, "stt", URLS["stt"], use_current_window=False)
+        role_urls.append(("stt", URLS["stt"]))
+
+    first_role, first_url = role_urls[0]
+    if not _navigate_first_window_via_cdp(driver, first_role, first_url):
+        _open_role_page(driver, first_role, first_url, use_current_window=True)
+    for role, url in _open_role_windows_via_cdp(driver, role_urls[1:]):
+        _open_role_page(driver, role, url, use_current_window=False)
         time.sleep(WINDOW_OPEN_DELAY)
+    _wait_role_pages_loaded(driver, [role for role, _url in role_urls])
 
 
 def open_class_page_separate():
@@ -1159,7 +1406,8 @@ def open_class_page_separate():
     if not ok:
         return None
 
-    time.sleep(CHROME_STARTUP_WAIT)
+    if not wait_devtools_ready(CLASS_DEBUG_PORT):
+        print(f"[prepare] class: DevTools not answering on :{CLASS_DEBUG_PORT} yet; connecting anyway.")
     class_driver = connect_webdriver(CLASS_DEBUG_ADDR)
     _collapse_to_single_window(class_driver, label="class")
     _open_role_page(class_driver, "class", URLS["nativecamp"], use_current_window=True)
@@ -1178,7 +1426,8 @@ def open_stt_page_separate():
     if not ok:
         return None
 
-    time.sleep(CHROME_STARTUP_WAIT)
+    if not wait_devtools_ready(STT_DEBUG_PORT):
+        print(f"[prepare] stt: DevTools not answering on :{STT_DEBUG_PORT} yet; connecting anyway.")
     stt_driver = connect_webdriver(STT_DEBUG_ADDR)
     _collapse_to_single_window(stt_driver, label="stt")
     _open_role_page(stt_driver, "stt", URLS["stt"], use_current_window=True)
@@ -1205,7 +1454,8 @@ def open_teacher_page_separate():
     if not ok:
         return None
 
-    time.sleep(CHROME_STARTUP_WAIT)
+    if not wait_devtools_ready(TEACHER_DEBUG_PORT):
+        print(f"[prepare] teacher: DevTools not answering on :{TEACHER_DEBUG_PORT} yet; connecting anyway.")
     teacher_driver = connect_webdriver(TEACHER_DEBUG_ADDR)
     _collapse_to_single_window(teacher_driver, label="teacher")
     _open_role_page(teacher_driver, "teacher", URLS["akool"], use_current_window=True)
@@ -1259,7 +1509,7 @@ def _wmctrl_workspace_workarea(target_ws=None):
     if not selected_line:
         return None
 
-    m = re.search(r"WA:\s*(-?\d+),(-?\d+)\s+(\d+)x(\d+)", selected_line, re.IGNORECASE)
+    m = _RX_WMCTRL_WORKAREA.search(selected_line)
     if not m:
         return None
     try:
@@ -1332,6 +1582,33 @@ def _inflate_tab_rect(rect, workarea, multiplier=2.0):
     return (left, top, new_w, new_h)
 
 
+def _set_window_bounds_via_cdp(driver, handle, x, y, w, h):
+    """
+    Move+resize the window holding `handle` without switching to it.
+    setWindowBounds replies after the bounds are applied, so callers need no
+    settle delay. Returns False when CDP is unavailable.
+    """
+    try:
+        res = driver.execute_cdp_cmd("Browser.getWindowForTarget", {"targetId": str(handle)})
+        window_id = int(res["windowId"])
+        driver.execute_cdp_cmd(
+            "Browser.setWindowBounds",
+            {
+                "windowId": window_id,
+                "bounds": {
+                    "left": int(x),
+                    "top": int(y),
+                    "width": int(w),
+                    "height": int(h),
+                    "windowState": "normal",
+                },
+            },
+        )
+        return True
+    except Exception:
+        return False
+
+
 def arrange_windows(main_driver, teacher_driver=None, class_driver=None, stt_driver=None, tabs_workspace=None):
     """
     Arrange non-teacher roles in Ubuntu-like snap layout:
@@ -1395,6 +1672,12 @@ def arrange_windows(main_driver, teacher_driver=None, class_driver=None, stt_dri
                 continue
             print(f"[prepare] tab layout wmctrl fallback role={role}: {note_rect}")
 
+        if _set_window_bounds_via_cdp(driver, handle, x, y, w, h):
+            print(
+                f"[prepare] tab layout applied role={role} "
+                f"slot={slot_idx} rect={x},{y} {w}x{h} via=cdp."
+            )
+            continue
         try:
             driver.switch_to.window(handle)
             try:
@@ -1439,6 +1722,16 @@ def apply_saved_role_layout(main_driver, teacher_driver=None, class_driver=None,
         role_driver = role_to_driver.get(role)
         if not rect or not handle or role_driver is None:
             continue
+        if _set_window_bounds_via_cdp(
+            role_driver,
+            handle,
+            rect["x"],
+            rect["y"],
+            rect["width"],
+            rect["height"],
+        ):
+            applied.append(role)
+            continue
         try:
             role_driver.switch_to.window(handle)
             try:
@@ -1554,7 +1847,7 @@ def _xprop_workspace_count():
     except Exception:
         return None
     out = str(proc.stdout or "")
-    m = re.search(r"_NET_NUMBER_OF_DESKTOPS\(CARDINAL\)\s*=\s*(\d+)", out)
+    m = _RX_XPROP_DESKTOPS.search(out)
     if not m:
         return None
     try:
@@ -1811,12 +2104,7 @@ def _resolve_x11_window_id_for_rect_via_xwininfo(rect):
         return None
 
     out = proc.stdout or ""
-    # Example line prefix:
-    # 0x4e00007 "Title": ("google-chrome" "Google-chrome")  960x540+0+0  +0+0
-    rx = re.compile(
-        r"^\s*(0x[0-9a-f]+)\s+.*?\s+(\d+)x(\d+)\+(-?\d+)\+(-?\d+)\s",
-        re.IGNORECASE,
-    )
+    rx = _RX_XWININFO_TREE_GEOM
     best_id = None
     best_score = None
     for line in out.splitlines():
@@ -1824,13 +2112,8 @@ def _resolve_x11_window_id_for_rect_via_xwininfo(rect):
         if not m:
             continue
         wid = m.group(1)
-        try:
-            w = int(m.group(2))
-            h = int(m.group(3))
-            x = int(m.group(4))
-            y = int(m.group(5))
-        except Exception:
-            continue
+        # The pattern only admits digits, so int() cannot fail here.
+        w, h, x, y = map(int, m.group(2, 3, 4, 5))
 
         # Ignore windows far from target geometry.
         if abs(x - tx) > 180 or abs(y - ty) > 180:
@@ -1859,7 +2142,8 @@ def _resolve_x11_window_id_for_rect(rect, title_hint="", preferred_pids=None):
         return None
 
     hint = str(title_hint or "").strip().lower()
-    hint_tokens = [tok for tok in re.split(r"\s+", hint) if len(tok) >= 4][:4]
+    hint_tokens = [tok for tok in hint.split() if len(tok) >= 4][:4]
+    tok_rx = re.compile("|".join(map(re.escape, hint_tokens))) if hint_tokens else None
     preferred_pid_set = set()
     if isinstance(preferred_pids, (list, tuple, set)):
         for raw_pid in preferred_pids:
@@ -1908,7 +2192,7 @@ def _resolve_x11_window_id_for_rect(rect, title_hint="", preferred_pids=None):
             title = str(row.get("title", "")).lower()
             if title and hint in title:
                 score -= 80
-            elif title and any(tok in title for tok in hint_tokens):
+            elif title and tok_rx is not None and tok_rx.search(title):
                 score -= 24
             else:
                 score += 40
@@ -2271,7 +2555,7 @@ def _xprop_window_state_atoms(wid):
     if proc.returncode != 0:
         return None
     text = str(proc.stdout or "")
-    return set(re.findall(r"_NET_WM_STATE_[A-Z_]+", text))
+    return set(_RX_NET_WM_STATE.findall(text))
 
 
 def _wmctrl_set_window_maximized(wid):
@@ -3060,11 +3344,11 @@ def launch_environment(base_workspace=None):
     if not ok:
         return None
 
-    time.sleep(CHROME_STARTUP_WAIT)
+    if not wait_devtools_ready(DEBUG_PORT):
+        print(f"[prepare] main: DevTools not answering on :{DEBUG_PORT} yet; connecting anyway.")
     main_driver = connect_webdriver(DEBUG_ADDR)
     _collapse_to_single_window(main_driver, label="main")
 
-    time.sleep(0.5)
     teacher_driver = None
     class_driver = None
     stt_driver = None
@@ -2,11 +2,15 @@ from __future__ import annotations
 
 from flask import Flask, request, jsonify, send_from_directory, Response
 from flask_cors import CORS
+import atexit
 import json
 import os
+import queue
 import re
 import secrets
+import signal
 import socket
+import sys
 import threading
 import time
 from typing import Any
@@ -55,6 +59,13 @@ _rule_cache = {}  # path -> (mtime, text)
 # In-memory structured event log for debugging.
 _event_log = []  # list[dict]
 _EVENT_LOG_MAX = 5000
+# /pipeline_stream subscribers; guarded with _event_log so a new stream's
+# backlog and its live feed never overlap or drop an entry.
+_event_subscribers = []  # list[queue.SimpleQueue]
+_event_log_lock = threading.Lock()
+# Monotonic per-process event number; stream clients resume with ?since=<seq>.
+_event_seq = 0
+_PIPELINE_STREAM_KEEPALIVE_S = 15.0
 
 _run_files_by_id = {}  # run_id -> file_path
 _run_events_by_id = {}  # run_id -> list[event_entry]
@@ -378,15 +389,21 @@ def _append_run_event(run_id, event_entry):
 
 
 def _log_event(event, data=None, level="info"):
+    global _event_seq
     entry = {
         "ts": _now_ms(),
         "level": level,
         "event": event,
         "data": data or {}
     }
-    _event_log.append(entry)
-    if len(_event_log) > _EVENT_LOG_MAX:
-        del _event_log[: len(_event_log) - _EVENT_LOG_MAX]
+    with _event_log_lock:
+        _event_seq += 1
+        entry["seq"] = _event_seq
+        _event_log.append(entry)
+        if len(_event_log) > _EVENT_LOG_MAX:
+            del _event_log[: len(_event_log) - _EVENT_LOG_MAX]
+        for q in _event_subscribers:
+            q.put(entry)
     print("[route_log] " + json.dumps(entry, ensure_ascii=True))
     try:
         run_id = _extract_flow_run_id_from_obj(entry.get("data") or {})
@@ -656,6 +673,7 @@ def _get_audio_bridge(ensure=False):
                     logs_dir=LOGS_DIR,
                     segment_seconds=AUDIO_SEGMENT_SECONDS,
                 )
+                atexit.register(_audio_bridge.close)
             except Exception as e:
                 _audio_bridge_error = str(e)
                 return None
@@ -1401,13 +1419,12 @@ def inject_student_audio():
     return jsonify({"status": "ok" if play.get("ok") else "error", "result": play, "segment_id": segment_id}), code
 
 
-@app.route("/pipeline_status", methods=["GET"])
-def pipeline_status():
+def _pipeline_status_payload(limit_n: int) -> dict:
     global _audio_bridge_ready_logged
     bridge = _get_audio_bridge(ensure=True)
     if bridge is not None:
         try:
-            bridge_status = bridge.status()
+            bridge_status = dict(bridge.status())
             if bridge_status.get("ready") and not _audio_bridge_ready_logged:
                 _audio_bridge_ready_logged = True
                 _log_event(
@@ -1424,22 +1441,27 @@ def pipeline_status():
     else:
         bridge_status = {"ready": False, "error": _audio_bridge_error or "audio_bridge_unavailable"}
 
-    limit = request.args.get("limit", "200")
-    try:
-        limit_n = int(limit)
-    except Exception:
-        limit_n = 200
-
-    out = {
+    return {
         "status": "ok",
         "audio_bridge": bridge_status,
         "roles": list(message_queues_by_role.keys()),
-        "queues": {role: len(queue) for role, queue in message_queues_by_role.items()},
+        "queues": {role: len(msgs) for role, msgs in message_queues_by_role.items()},
         "last_segment_ids": dict(_pipeline_last_ids),
         "segments": _pipeline_recent_segments(limit=limit_n),
         "ts": _now_ms(),
     }
-    return jsonify(out), 200
+
+
+def _request_limit(default: int = 200) -> int:
+    try:
+        return int(request.args.get("limit", str(default)))
+    except Exception:
+        return default
+
+
+@app.route("/pipeline_status", methods=["GET"])
+def pipeline_status():
+    return jsonify(_pipeline_status_payload(_request_limit())), 200
 
 
 @app.route("/log_event", methods=["POST"])
@@ -1480,12 +1502,71 @@ def dequeue_messages(receiver):
 @app.route("/get_logs", methods=["GET"])
 def get_logs():
     clear = request.args.get("clear") == "1"
-    out = list(_event_log)
-    if clear:
-        _event_log.clear()
+    with _event_log_lock:
+        out = list(_event_log)
+        if clear:
+            _event_log.clear()
     return jsonify({"events": out}), 200
 
 
+@app.route("/pipeline_tick", methods=["GET"])
+def pipeline_tick():
+    """
+    /pipeline_status and /get_logs in one round trip for pollers.
+    """
+    out = {"status": None, "events": []}
+    if request.args.get("include_status") == "1":
+        out["status"] = _pipeline_status_payload(_request_limit())
+    with _event_log_lock:
+        out["events"] = list(_event_log)
+        if request.args.get("clear_logs") == "1":
+            _event_log.clear()
+    return jsonify(out), 200
+
+
+@app.route("/pipeline_stream", methods=["GET"])
+def pipeline_stream():
+    """
+    Newline-delimited JSON event feed: current backlog first, then live events.
+    Blank lines are keepalives. ?since=<seq> skips events a reconnecting client
+    already received (ignored if it is ahead of us, i.e. the router restarted).
+    """
+    clear = request.args.get("clear") == "1"
+    try:
+        since = int(request.args.get("since") or 0)
+    except ValueError:
+        since = 0
+    q = queue.SimpleQueue()
+    with _event_log_lock:
+        if since > _event_seq:
+            since = 0
+        backlog = [entry for entry in _event_log if entry["seq"] > since]
+        if clear:
+            _event_log.clear()
+        _event_subscribers.append(q)
+
+    def generate():
+        try:
+            for entry in backlog:
+                yield json.dumps(entry, ensure_ascii=True) + "\n"
+            yield "\n"
+            while True:
+                try:
+                    entry = q.get(timeout=_PIPELINE_STREAM_KEEPALIVE_S)
+                except queue.Empty:
+                    yield "\n"
+                    continue
+                yield json.dumps(entry, ensure_ascii=True) + "\n"
+        finally:
+            with _event_log_lock:
+                try:
+                    _event_subscribers.remove(q)
+                except ValueError:
+                    pass
+
+    return Response(generate(), mimetype="application/x-ndjson", headers={"Cache-Control": "no-cache"})
+
+
 def _start_https_mirror_server():
     global _walkie_tls_ready
     if not WALKIE_ENABLE_TLS:
@@ -1547,9 +1628,16 @@ def _start_https_mirror_server():
 
 # ================== RUN ==================
 if __name__ == "__main__":
+    # The launcher stops us with SIGTERM; raise SystemExit out of app.run so
+    # the audio bridge is closed before the interpreter joins its job workers.
+    signal.signal(signal.SIGTERM, lambda *_args: sys.exit(0))
     # Pre-create virtual sink/source before Selenium opens STT page so the
     # browser can discover the configured microphone device immediately.
     _get_audio_bridge(ensure=True)
     _start_https_mirror_server()
     _log_event("walkie_info", _walkie_info_payload())
-    app.run(host="0.0.0.0", port=5000, threaded=True)
+    try:
+        app.run(host="0.0.0.0", port=5000, threaded=True)
+    finally:
+        if _audio_bridge is not None:
+            _audio_bridge.close()
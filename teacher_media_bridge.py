@@ -278,6 +278,8 @@ class TeacherMediaBridge:
         self._status_cache: dict[str, Any] | None = None
         self._status_cache_ts: float = 0.0
         self._status_cache_ttl_s: float = 2.5
+        # Optional no-arg callback, run on the stderr reader thread once ffmpeg exits.
+        self.on_ffmpeg_exit = None
 
     def _append_stderr_line(self, line: str):
         text = str(line or "").strip()
@@ -296,7 +298,14 @@ class TeacherMediaBridge:
                 with self._lock:
                     self._append_stderr_line(raw)
         except Exception:
-            return
+            pass
+        finally:
+            cb = self.on_ffmpeg_exit
+            if cb is not None:
+                try:
+                    cb()
+                except Exception:
+                    pass
 
     def _display_value(self) -> str:
         value = str(self.capture_display or "").strip()